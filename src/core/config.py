@@ -3,6 +3,7 @@
 import json
 import platform
 import shutil
+import threading
 from pathlib import Path
 
 
@@ -11,6 +12,9 @@ class Config:
     
     APP_NAME = "AWG-Kumulus"
     
+    # Serializes writers; the GUI may save on a worker thread
+    _save_lock = threading.Lock()
+    
     # Platform-specific paths
     if platform.system() == "Windows":
         APPDATA_DIR = Path.home() / "AppData" / "Roaming" / APP_NAME
@@ -150,8 +154,10 @@ class Config:
     @classmethod
     def save_config(cls, config):
         """Save configuration to file."""
-        with open(cls.CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        with cls._save_lock:
+            data = json.dumps(config, indent=2)
+            with open(cls.CONFIG_FILE, 'w') as f:
+                f.write(data)
     
     @classmethod
     def get_tool_path(cls, tool_name):
@@ -16,12 +16,41 @@ from enum import Enum
 from pathlib import Path
 import re
 
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
 from .logger import setup_logger
 from .config import Config
 
 logger = setup_logger("DeviceDetector")
 
 
+def _format_hex(value: Optional[object]) -> Optional[str]:
+    """Format value as 0xXXXX safely for int or str inputs."""
+    if value is None:
+        return None
+    try:
+        if isinstance(value, int):
+            return f"0x{value:04X}"
+        if isinstance(value, str):
+            s = value.strip()
+            if s.startswith("0x") or s.startswith("0X"):
+                v = int(s, 16)
+                return f"0x{v:04X}"
+            # Try decimal then hex fallback
+            try:
+                v = int(s)
+                return f"0x{v:04X}"
+            except ValueError:
+                v = int(s, 16)
+                return f"0x{v:04X}"
+    except Exception:
+        return str(value)
+    return str(value)
+
+
 class BoardType(Enum):
     """Supported board types."""
     STM32 = "STM32"
@@ -66,31 +95,40 @@ class Device:
         if self.last_seen is None:
             self.last_seen = datetime.now().isoformat()
     
+    @property
+    def vid_pid(self) -> str:
+        """VID:PID as '0xXXXX:0xXXXX', or 'N/A'; formatted once per VID/PID pair."""
+        key = (self.vid, self.pid)
+        cached = self.__dict__.get('_vid_pid_cache')
+        if cached is None or cached[0] != key:
+            if self.vid and self.pid:
+                text = f"{_format_hex(self.vid)}:{_format_hex(self.pid)}"
+            else:
+                text = "N/A"
+            cached = (key, text)
+            self.__dict__['_vid_pid_cache'] = cached
+        return cached[1]
+
+    @property
+    def display_label(self) -> str:
+        """'<board> - <port> (<manufacturer>)' list label; rebuilt only when those fields change."""
+        key = (self.board_type, self.port, self.manufacturer)
+        cached = self.__dict__.get('_display_label_cache')
+        if cached is None or cached[0] != key:
+            text = f"{self.board_type.value} - {self.port}"
+            if self.manufacturer:
+                text += f" ({self.manufacturer})"
+            cached = (key, text)
+            self.__dict__['_display_label_cache'] = cached
+        return cached[1]
+
+    @property
+    def last_seen_date(self) -> Optional[str]:
+        """Date part (YYYY-MM-DD) of the ISO-8601 last_seen timestamp."""
+        return self.last_seen[:10] if self.last_seen else None
+
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        def _format_hex(value: Optional[object]) -> Optional[str]:
-            """Format value as 0xXXXX safely for int or str inputs."""
-            if value is None:
-                return None
-            try:
-                if isinstance(value, int):
-                    return f"0x{value:04X}"
-                if isinstance(value, str):
-                    s = value.strip()
-                    if s.startswith("0x") or s.startswith("0X"):
-                        v = int(s, 16)
-                        return f"0x{v:04X}"
-                    # Try decimal then hex fallback
-                    try:
-                        v = int(s)
-                        return f"0x{v:04X}"
-                    except ValueError:
-                        v = int(s, 16)
-                        return f"0x{v:04X}"
-            except Exception:
-                return str(value)
-            return str(value)
-
         return {
             "port": self.port,
             "board_type": self.board_type.value,
@@ -151,6 +189,13 @@ class Device:
 class DeviceDetector:
     """Detects and manages connected embedded boards with enhanced features."""
     
+    # Monitoring cadence (seconds): fast right after a hot-swap, backing off by MONITOR_BACKOFF while idle
+    MONITOR_ACTIVE_INTERVAL = 0.5
+    MONITOR_IDLE_INTERVAL = 10.0
+    MONITOR_BACKOFF = 1.5
+    # With OS hot-plug notifications polling is only a safety net for missed events
+    MONITOR_HOTPLUG_IDLE_INTERVAL = 60.0
+    
     def __init__(self):
         self.logger = logger
         self.device_history: Dict[str, Device] = {}
@@ -159,7 +204,11 @@ class DeviceDetector:
         self._paused = False  # Flag to pause monitoring temporarily
         self.monitoring_thread: Optional[threading.Thread] = None
         self.monitoring_callback: Optional[Callable] = None
-        self.monitoring_interval = 5.0  # seconds - increased from 2.0 to reduce frequency
+        self.monitoring_interval = 5.0  # seconds - starting poll interval; see _next_poll_interval
+        # Set by notify_hotplug to wake the monitoring loop before its next poll
+        self._hotplug_event = threading.Event()
+        self.hotplug_backend: Optional[str] = None  # e.g. "udev" or "WM_DEVICECHANGE"
+        self._udev_observer = None
         self.device_history_file = Path(Config.get_app_data_dir()) / "device_history.json"
         self.templates_file = Path(Config.get_app_data_dir()) / "device_templates.json"
         
@@ -963,6 +1012,7 @@ q
         
         self.monitoring_callback = callback
         self.monitoring_active = True
+        self._start_udev_observer()
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitoring_thread.start()
         logger.info("Started real-time device monitoring")
@@ -980,15 +1030,62 @@ q
     def stop_real_time_monitoring(self):
         """Stop real-time device monitoring."""
         self.monitoring_active = False
+        self._hotplug_event.set()
+        if self._udev_observer is not None:
+            try:
+                self._udev_observer.stop()
+            except Exception:
+                pass
+            self._udev_observer = None
+            self.hotplug_backend = None
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=1)
         logger.info("Stopped real-time device monitoring")
     
+    def notify_hotplug(self, backend: Optional[str] = None):
+        """Wake the monitoring loop now; safe to call from any thread.
+
+        Passing a backend name also marks hot-plug notifications as available,
+        which lets the idle poll back off to MONITOR_HOTPLUG_IDLE_INTERVAL.
+        """
+        if backend:
+            self.hotplug_backend = backend
+        self._hotplug_event.set()
+
+    def _start_udev_observer(self):
+        """Subscribe to udev serial-port events on Linux when pyudev is installed."""
+        if pyudev is None or not sys.platform.startswith("linux") or self._udev_observer is not None:
+            return
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by(subsystem="tty")
+            observer = pyudev.MonitorObserver(
+                monitor, lambda action, device: self._hotplug_event.set(), name="udev-hotplug"
+            )
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            logger.warning(f"udev hot-plug monitoring unavailable, polling only: {e}")
+            return
+        self._udev_observer = observer
+        self.hotplug_backend = "udev"
+        logger.info("Using udev hot-plug notifications")
+
+    def _next_poll_interval(self, interval: float, changed: bool) -> float:
+        """Poll quickly right after a change, then back off towards the idle interval."""
+        if changed:
+            return self.MONITOR_ACTIVE_INTERVAL
+        idle = self.MONITOR_HOTPLUG_IDLE_INTERVAL if self.hotplug_backend else self.MONITOR_IDLE_INTERVAL
+        return min(interval * self.MONITOR_BACKOFF, max(idle, self.monitoring_interval))
+    
     def _monitoring_loop(self):
         """Main monitoring loop - only detects changes, not continuous scanning."""
         previous_devices = set()
+        interval = self.monitoring_interval
+        woken = False
         
         while self.monitoring_active:
+            changed = False
             try:
                 if self._paused:
                     time.sleep(1)
@@ -1000,6 +1097,7 @@ q
                 
                 # Only process if there are actual changes
                 if current_device_ids != previous_devices:
+                    changed = True
                     # Check for new devices
                     new_devices = current_device_ids - previous_devices
                     if new_devices:
@@ -1030,7 +1128,10 @@ q
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
             
-            time.sleep(self.monitoring_interval)
+            # A hot-plug wake-up counts as activity: ports can appear just after the event
+            interval = self._next_poll_interval(interval, changed or woken)
+            woken = self._hotplug_event.wait(interval)
+            self._hotplug_event.clear()
     
     def get_device_health_score(self, device: Device) -> int:
         """Calculate device health score based on various factors."""
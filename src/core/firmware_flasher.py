@@ -1,7 +1,6 @@
 """Enhanced firmware flashing with advanced management integration."""
 
 import subprocess
-import requests
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any, List
 import tempfile
@@ -12,7 +11,7 @@ from PySide6.QtCore import QCoreApplication
 from .config import Config
 from .logger import setup_logger
 from .device_detector import Device, BoardType
-from .firmware_manager import FirmwareManager, FirmwareInfo, FirmwareSource
+from .firmware_manager import FirmwareManager, FirmwareInfo, FirmwareSource, DOWNLOAD_CHUNK_SIZE, preallocate_file
 
 logger = setup_logger("FirmwareFlasher")
 
@@ -121,25 +120,29 @@ class FirmwareFlasher(QObject):
             if progress_callback:
                 progress_callback(QCoreApplication.translate("FirmwareFlasher", "Downloading firmware from {}...").format(url))
             
-            response = requests.get(url, stream=True)
+            response = self.firmware_manager.http_session.get(url, stream=True)
             response.raise_for_status()
             
-            # Create temp file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.bin')
-            
             # Download with progress
             total_size = int(response.headers.get('content-length', 0))
             downloaded = 0
+            last_progress = -1
+            
+            # Stream straight into a temp file
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.bin') as temp_file:
+                preallocate_file(temp_file, total_size)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        temp_file.write(chunk)
+                        downloaded += len(chunk)
+                        if progress_callback and total_size > 0:
+                            progress = (downloaded / total_size) * 100
+                            # Report at most once per tenth of a percent
+                            if int(progress * 10) != last_progress:
+                                last_progress = int(progress * 10)
+                                progress_callback(QCoreApplication.translate("FirmwareFlasher", "Downloading: {:.1f}%").format(progress))
+                temp_file.truncate(downloaded)
             
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    temp_file.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback and total_size > 0:
-                        progress = (downloaded / total_size) * 100
-                        progress_callback(QCoreApplication.translate("FirmwareFlasher", "Downloading: {:.1f}%").format(progress))
-            
-            temp_file.close()
             return Path(temp_file.name)
             
         except Exception as e:
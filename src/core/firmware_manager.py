@@ -2,6 +2,7 @@
 
 import json
 import hashlib
+import os
 import requests
 import subprocess
 import tempfile
@@ -19,6 +20,28 @@ from .device_detector import Device
 logger = setup_logger("FirmwareManager")
 
 
+# Firmware images are a few MiB; large chunks keep per-chunk Python overhead low
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+
+def preallocate_file(f, size: int):
+    """Reserve size bytes for an open file where the platform supports it."""
+    if size > 0 and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass
+
+
+def _build_http_session() -> requests.Session:
+    """Create a pooled HTTP session so release lookups and downloads reuse connections."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class FirmwareSource(Enum):
     """Firmware source types."""
     LOCAL_FILE = "local_file"
@@ -110,6 +133,7 @@ class FirmwareManager:
         self.firmware_database: Dict[str, FirmwareInfo] = {}
         self.firmware_backups: Dict[str, List[FirmwareBackup]] = {}
         self.device_firmware: Dict[str, FirmwareInfo] = {}  # device_id -> current firmware
+        self.http_session = _build_http_session()
         
         # File paths
         self.app_data_dir = Path(Config.get_app_data_dir())
@@ -241,7 +265,7 @@ class FirmwareManager:
             else:
                 release_url = f"https://api.github.com/repos/{owner}/{repo_name}/releases/latest"
             
-            response = requests.get(release_url, timeout=30)
+            response = self.http_session.get(release_url, timeout=30)
             response.raise_for_status()
             release_data = response.json()
             
@@ -299,7 +323,7 @@ class FirmwareManager:
             else:
                 # Get latest successful pipeline
                 pipelines_url = f"https://gitlab.com/api/v4/projects/{project_id}/pipelines"
-                response = requests.get(pipelines_url, params={'status': 'success', 'per_page': 1}, timeout=30)
+                response = self.http_session.get(pipelines_url, params={'status': 'success', 'per_page': 1}, timeout=30)
                 response.raise_for_status()
                 pipelines = response.json()
                 if not pipelines:
@@ -312,13 +336,13 @@ class FirmwareManager:
                 pipeline_id = pipelines[0]['id']
                 pipeline_url = f"https://gitlab.com/api/v4/projects/{project_id}/pipelines/{pipeline_id}"
             
-            response = requests.get(pipeline_url, timeout=30)
+            response = self.http_session.get(pipeline_url, timeout=30)
             response.raise_for_status()
             pipeline_data = response.json()
             
             # Get job artifacts
             jobs_url = f"https://gitlab.com/api/v4/projects/{project_id}/pipelines/{pipeline_id}/jobs"
-            response = requests.get(jobs_url, timeout=30)
+            response = self.http_session.get(jobs_url, timeout=30)
             response.raise_for_status()
             jobs = response.json()
             
@@ -380,7 +404,7 @@ class FirmwareManager:
         """Add firmware from URL."""
         try:
             # Get file information from URL
-            response = requests.head(url, timeout=30)
+            response = self.http_session.head(url, timeout=30)
             response.raise_for_status()
             
             content_length = response.headers.get('content-length')
@@ -432,7 +456,7 @@ class FirmwareManager:
             if progress_callback:
                 progress_callback(QCoreApplication.translate("FirmwareManager", "Downloading {}...").format(firmware_info.name))
             
-            response = requests.get(firmware_info.url, stream=True, timeout=300)
+            response = self.http_session.get(firmware_info.url, stream=True, timeout=300)
             response.raise_for_status()
             
             # Determine file extension
@@ -447,16 +471,23 @@ class FirmwareManager:
             # Download with progress
             total_size = int(response.headers.get('content-length', 0))
             downloaded_size = 0
+            last_progress = -1
             
             with open(download_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                preallocate_file(f, total_size)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
                         downloaded_size += len(chunk)
                         
                         if progress_callback and total_size > 0:
                             progress = int((downloaded_size / total_size) * 100)
-                            progress_callback(QCoreApplication.translate("FirmwareManager", "Downloading {}... {}%").format(firmware_info.name, progress))
+                            # Only report whole-percent changes
+                            if progress != last_progress:
+                                last_progress = progress
+                                progress_callback(QCoreApplication.translate("FirmwareManager", "Downloading {}... {}%").format(firmware_info.name, progress))
+                # Drop any reserved space the server over-announced
+                f.truncate(downloaded_size)
             
             # Update firmware info
             firmware_info.file_path = str(download_path)
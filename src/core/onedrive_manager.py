@@ -2,24 +2,65 @@
 
 import os
 import json
+import time
+import hashlib
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import shutil
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from .config import Config
 from .logger import setup_logger
 from .device_detector import Device
 
 logger = setup_logger("OneDriveManager")
 
+COPY_CHUNK_SIZE = 1 << 16
+
+
+def copy_with_checksum(src: Path, dst: Path) -> Tuple[int, str]:
+    """Copy src to dst like shutil.copy2, returning (bytes copied, SHA-256 hex digest).
+
+    The digest is computed from the chunks as they are copied, so the file is read once.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        for chunk in iter(lambda: fsrc.read(COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            fdst.write(chunk)
+            size += len(chunk)
+    shutil.copystat(src, dst)
+    return size, digest.hexdigest()
+
 
 class OneDriveManager:
     """Manages OneDrive integration for machine data storage."""
     
-    def __init__(self):
+    # Seconds a list_machines() result is reused before the folders are walked again
+    LIST_MACHINES_TTL = 10.0
+    
+    def __init__(self, config: Optional[Dict] = None):
+        """Use config if given (e.g. unsaved settings to test), otherwise the saved configuration."""
         self.logger = logger
-        self.config = Config.load_config()
+        self.config = config if config is not None else Config.load_config()
+        # (user folder, machine type) -> (time.monotonic() of the scan, machines)
+        self._machines_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[Dict]]] = {}
+        self._applied_onedrive = dict(self.config.get('onedrive', {}))
+    
+    def apply_config(self, config: Dict):
+        """Switch to config, dropping cached machine listings only if the OneDrive settings changed."""
+        # Compared against a snapshot, since callers may pass the same dict after editing it in place
+        onedrive = dict(config.get('onedrive', {}))
+        if onedrive != self._applied_onedrive:
+            self._machines_cache.clear()
+        self._applied_onedrive = onedrive
+        self.config = config
     
     def is_enabled(self) -> bool:
         """Check if OneDrive integration is enabled."""
@@ -156,6 +197,7 @@ class OneDriveManager:
                 json.dump(machine_data, f, indent=2, ensure_ascii=False)
             
             logger.info(f"Saved machine data to OneDrive: {machine_file}")
+            self._machines_cache.clear()
             return True
             
         except Exception as e:
@@ -185,7 +227,9 @@ class OneDriveManager:
             new_firmware_name = f"{timestamp}_{firmware_name}"
             
             destination = firmware_folder / new_firmware_name
-            shutil.copy2(firmware_path, destination)
+            file_size, checksum = copy_with_checksum(firmware_path, destination)
+            if not firmware_info.get("hash"):
+                firmware_info = {**firmware_info, "hash": checksum}
             
             # Save firmware info
             firmware_data = {
@@ -194,7 +238,7 @@ class OneDriveManager:
                 "firmware_info": firmware_info,
                 "stored_at": datetime.now().isoformat(),
                 "stored_by": operator_name,
-                "file_size": destination.stat().st_size
+                "file_size": file_size
             }
             
             info_file = firmware_folder / f"{timestamp}_firmware_info.json"
@@ -231,8 +275,11 @@ class OneDriveManager:
             logger.error(f"Failed to get machine history: {e}")
             return None
     
-    def list_machines(self, machine_type: Optional[str] = None) -> List[Dict]:
-        """List all machines in OneDrive."""
+    def list_machines(self, machine_type: Optional[str] = None, force_refresh: bool = False) -> List[Dict]:
+        """List all machines in OneDrive.
+        
+        Results are reused for LIST_MACHINES_TTL seconds; force_refresh walks the folders again.
+        """
         try:
             if not self.is_enabled():
                 return []
@@ -241,43 +288,48 @@ class OneDriveManager:
             if not user_folder or not user_folder.exists():
                 return []
             
+            key = (str(user_folder), machine_type)
+            cached = self._machines_cache.get(key)
+            if cached and not force_refresh and time.monotonic() - cached[0] < self.LIST_MACHINES_TTL:
+                return list(cached[1])
+            
             machines = []
             
             if machine_type:
                 # List machines of specific type
                 type_folder = user_folder / machine_type
                 if type_folder.exists():
-                    for machine_folder in type_folder.iterdir():
-                        if machine_folder.is_dir():
-                            machine_file = machine_folder / f"{machine_folder.name}_data.json"
-                            if machine_file.exists():
-                                try:
-                                    with open(machine_file, 'r', encoding='utf-8') as f:
-                                        data = json.load(f)
-                                        machines.append(data["machine_info"])
-                                except:
-                                    pass
+                    for machine_folder in self._subfolders(type_folder):
+                        self._append_machine_info(machines, machine_folder)
             else:
                 # List all machines
-                for type_folder in user_folder.iterdir():
-                    if type_folder.is_dir():
-                        for machine_folder in type_folder.iterdir():
-                            if machine_folder.is_dir():
-                                machine_file = machine_folder / f"{machine_folder.name}_data.json"
-                                if machine_file.exists():
-                                    try:
-                                        with open(machine_file, 'r', encoding='utf-8') as f:
-                                            data = json.load(f)
-                                            machines.append(data["machine_info"])
-                                    except:
-                                        pass
+                for type_folder in self._subfolders(user_folder):
+                    for machine_folder in self._subfolders(type_folder):
+                        self._append_machine_info(machines, machine_folder)
             
-            return machines
+            self._machines_cache[key] = (time.monotonic(), machines)
+            return list(machines)
             
         except Exception as e:
             logger.error(f"Failed to list machines: {e}")
             return []
     
+    @staticmethod
+    def _subfolders(folder: Path) -> List[Path]:
+        """Return folder's subdirectories, using the type info scandir already has instead of a stat per entry."""
+        with os.scandir(folder) as entries:
+            return [Path(entry.path) for entry in entries if entry.is_dir()]
+    
+    @staticmethod
+    def _append_machine_info(machines: List[Dict], machine_folder: Path):
+        """Append the machine_info of machine_folder's data file, skipping missing or unreadable files."""
+        machine_file = machine_folder / f"{machine_folder.name}_data.json"
+        try:
+            # Parsed straight from bytes (orjson when installed) without a text decode pass
+            machines.append(_json_loads(machine_file.read_bytes())["machine_info"])
+        except Exception:
+            pass
+    
     def test_connection(self) -> Tuple[bool, str]:
         """Test OneDrive connection and folder access.
         If auto-create is enabled, create the base and user folders when missing.
@@ -7,6 +7,7 @@ from PySide6.QtCore import QObject, Signal, QCoreApplication
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import QApplication
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Any
 import json
 from pathlib import Path
@@ -16,6 +17,21 @@ from .logger import setup_logger
 
 logger = setup_logger("ThemeManager")
 
+# Guide/help panels keep the same light colours in every theme; labels opt in by object name
+GUIDE_STYLESHEET = """
+QLabel#GuideInfo, QLabel#GuideWarn, QLabel#GuideSuccess, QLabel#GuideTip, QLabel#GuideAzure {
+    color: #333;
+    font-size: 10px;
+    padding: 8px;
+    border-radius: 4px;
+}
+QLabel#GuideInfo { background: #f0f8ff; border: 1px solid #b0d4f1; }
+QLabel#GuideWarn { background: #fff0f0; border: 1px solid #f1b0b0; }
+QLabel#GuideSuccess { background: #f0fff0; border: 1px solid #b0f1b0; }
+QLabel#GuideTip { background: #fff8f0; border: 1px solid #f1d0b0; }
+QLabel#GuideAzure { background: #e6f7ff; border: 1px solid #1890ff; }
+"""
+
 
 class ThemeType(Enum):
     """Available theme types."""
@@ -222,8 +238,18 @@ class ThemeManager(QObject):
         """Get current theme name."""
         return self.current_theme.value
     
-    def get_theme_stylesheet(self, theme_type: ThemeType) -> str:
-        """Get additional stylesheet for theme."""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_theme_stylesheet(theme_type: ThemeType) -> str:
+        """Get additional stylesheet for theme, including the shared guide panel rules.
+
+        Depends only on theme_type (custom theme colours go through the palette), so it is built once per type.
+        """
+        return ThemeManager._theme_stylesheet(theme_type) + GUIDE_STYLESHEET
+
+    @staticmethod
+    def _theme_stylesheet(theme_type: ThemeType) -> str:
+        """Get the theme-specific part of the stylesheet."""
         if theme_type == ThemeType.DARK:
             return """
             /* Dark Theme Stylesheet */
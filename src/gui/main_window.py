@@ -2,7 +2,10 @@
 
 import sys
 import os
+import copy
+import json
 import time
+import threading
 import serial
 import platform
 import socket
@@ -12,6 +15,10 @@ import zipfile
 import re
 import requests
 from typing import Dict, Optional
+from functools import cached_property
+from itertools import islice
+if sys.platform == "win32":
+    import ctypes.wintypes
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QTableWidget, QTableWidgetItem, QPushButton, QLabel,
@@ -19,17 +26,15 @@ from PySide6.QtWidgets import (
     QGroupBox, QSplitter, QApplication, QHeaderView, QDialog,
     QDialogButtonBox, QCheckBox, QFileDialog, QListWidget, QListWidgetItem,
     QSpinBox, QTabWidget, QInputDialog, QMenu, QFormLayout, QStyledItemDelegate,
-    QProgressDialog, QScrollArea, QFrame, QStackedWidget
+    QProgressDialog, QScrollArea, QFrame, QStackedWidget, QTableView,
+    QTreeView, QFileSystemModel
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QRegularExpression, QCoreApplication, QLocale, QDateTime, QUrl, QProcess, QSize, QPoint
-from PySide6.QtGui import QFont, QRegularExpressionValidator, QDesktopServices, QIcon, QKeySequence, QColor, QPainter, QShortcut, QGuiApplication, QAction, QCursor
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTime, QTimer, QThread, QThreadPool, QRunnable, QObject, QAbstractNativeEventFilter, QFileSystemWatcher, Signal, QRegularExpression, QCoreApplication, QLocale, QDateTime, QUrl, QProcess, QSize, QPoint
+from PySide6.QtGui import QFont, QRegularExpressionValidator, QDesktopServices, QIcon, QKeySequence, QColor, QBrush, QPen, QPainter, QShortcut, QGuiApplication, QAction, QCursor
 from PySide6.QtWidgets import QStyle, QSizePolicy
 
 from ..core.config import Config
 from ..core.device_detector import DeviceDetector, Device, BoardType
-from ..core.report_generator import ReportGenerator
-from ..core.email_sender import EmailSender
-from ..core.firmware_flasher import FirmwareFlasher
 from ..core.bootstrap import BootstrapManager
 from ..core.logger import setup_logger
 from ..core.theme_manager import ThemeManager, ThemeType
@@ -38,7 +43,6 @@ from ..core.version import get_version
 from ..core.updater import AppUpdater
 from ..gui.theme_language_dialog import ThemeLanguageSelectionDialog
 from ..gui.update_dialog import UpdateDialog, UpdateCheckWorker
-from ..core.onedrive_manager import OneDriveManager
 from ..core.system_info import get_timezone, get_location
 from ..core.utils import check_internet_connection
 from .tour_guide import TourManager
@@ -48,26 +52,327 @@ from .ui_styles import primary_button_style
 
 logger = setup_logger("MainWindow")
 
+# Bundled icons; PyInstaller unpacks them under sys._MEIPASS
+if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+    _ICON_DIR = Path(sys._MEIPASS) / "src" / "assets"
+else:
+    _ICON_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+# One block per device in the email summary; blocks are joined with a blank line
+_SUMMARY_TMPL = (
+    "Device {i}:\n"
+    "  Board Type: {bt}\n"
+    "  Port: {port}\n"
+    "  UID: {uid}\n"
+    "  Chip ID: {cid}\n"
+    "  MAC Address: {mac}\n"
+    "  Manufacturer: {mfr}\n"
+    "  Serial Number: {sn}\n"
+    "  Firmware Version: {fw}\n"
+    "  Hardware Version: {hw}\n"
+    "  Flash Size: {flash}\n"
+    "  CPU Frequency: {cpu}\n"
+    "  VID:PID: {vidpid}\n"
+)
+
+
+# OneDrive folder layout shown in the OneDrive settings dialog
+_ONEDRIVE_STRUCTURE_HTML = """
+    <b>OneDrive Folder Structure:</b><br><br>
+
+    <b>Base Folder:</b> {OneDrive Shared Folder}<br>
+    ├── <b>User Folder:</b> {User Name}_Work<br>
+    │   ├── <b>Machine Type Folder:</b> {Machine Type}<br>
+    │   │   ├── <b>Machine ID Folder:</b> {Machine ID}<br>
+    │   │   │   ├── <b>Machine Data:</b> {Machine ID}_data.json<br>
+    │   │   │   └── <b>Firmware Folder:</b> firmware/<br>
+    │   │   │       ├── <b>Firmware Files:</b> {timestamp}_{firmware}.bin<br>
+    │   │   │       └── <b>Firmware Info:</b> {timestamp}_firmware_info.json<br>
+    │   │   └── <b>Another Machine:</b> {Another Machine ID}/<br>
+    │   └── <b>Another Machine Type:</b> {Another Type}/<br>
+    └── <b>Another User:</b> {Another User}_Work/<br><br>
+
+    <b>Example:</b><br>
+    OneDrive/SharedFolder/<br>
+    ├── JohnDoe_Work/<br>
+    │   ├── Amphore/<br>
+    │   │   ├── AMP-1234567890/<br>
+    │   │   │   ├── AMP-1234567890_data.json<br>
+    │   │   │   └── firmware/<br>
+    │   │   │       ├── 20241028_143022_firmware_v2.1.bin<br>
+    │   │   │       └── 20241028_143022_firmware_info.json<br>
+    │   │   └── AMP-0987654321/<br>
+    │   └── BOKs/<br>
+    │       └── BOK-12345678/<br>
+    └── JaneSmith_Work/<br>
+    """
+_STRUCTURE_INFO_STYLE = (
+    "color: #333; font-size: 11px; background: #f9f9f9; padding: 15px; "
+    "border-radius: 5px; border: 1px solid #ddd;"
+)
+
+# Guide bodies for the OneDrive settings dialog, keyed by section
+_ONEDRIVE_GUIDE_HTML: Dict[str, str] = {
+    'setup': """
+    <b>[ONEDRIVE] OneDrive Setup:</b><br>
+    1. Install OneDrive: <a href="https://www.microsoft.com/en-us/microsoft-365/onedrive/download">Download OneDrive</a><br>
+    2. Sign in to your Microsoft account<br>
+    3. Create a shared folder or use existing OneDrive folder<br>
+    4. Copy the full path to your OneDrive folder<br>
+    5. Test the connection to verify access
+    """,
+    'alternatives': """
+    <b>[ALTERNATIVES] Alternative Cloud Services:</b><br>
+    • <b>Google Drive:</b> <a href="https://drive.google.com">drive.google.com</a> - Use Google Drive folder path<br>
+    • <b>Dropbox:</b> <a href="https://www.dropbox.com">dropbox.com</a> - Use Dropbox folder path<br>
+    • <b>iCloud:</b> <a href="https://www.icloud.com">icloud.com</a> - Use iCloud folder path<br>
+    • <b>Network Drive:</b> Use UNC path (\\\\server\\share) for network storage
+    """,
+    'troubleshooting': """
+    <b>[TROUBLESHOOTING] OneDrive Troubleshooting:</b><br>
+    • <b>Access Denied:</b> Check folder permissions and sharing settings<br>
+    • <b>Path Not Found:</b> Verify the folder path exists and is accessible<br>
+    • <b>Sync Issues:</b> Ensure OneDrive is running and synced<br>
+    • <b>Network Issues:</b> Check internet connection and firewall settings<br>
+    • <b>Still having issues?</b> Try: <a href="https://support.microsoft.com/en-us/onedrive">OneDrive Support</a>
+    """,
+}
+
+# Device history statistics footer; filled from DeviceDetector.get_device_statistics()
+_DEVICE_STATS_TMPL = (
+    "<b>Device Statistics:</b><br>"
+    "Total Devices: {total_devices}<br>"
+    "Connected: {connected_devices}<br>"
+    "Disconnected: {disconnected_devices}<br>"
+    "Templates: {templates_count}"
+)
+_STATS_LABEL_STYLE = "color: #333; font-size: 12px; background: #f0f0f0; padding: 10px; border-radius: 5px;"
+
+
+# Provider guide bodies for the email settings dialog, keyed by provider name
+_SMTP_GUIDE_HTML: Dict[str, str] = {
+    'Azure (Graph API)': """
+    <b>[EMAIL] Azure (Graph API) Configuration:</b><br>
+    1. Uses Microsoft Graph API for sending emails.<br>
+    2. Requires App Registration in Azure Portal.<br>
+    3. Configuration is loaded from config file (client_id, client_secret, etc.).<br>
+    <b>Note:</b> SMTP settings below are ignored when Azure is selected.<br>
+    """,
+    'Gmail': """
+    <b>[EMAIL] Gmail Configuration:</b><br>
+    1. Enable 2-Step Verification: <a href="https://myaccount.google.com/security">https://myaccount.google.com/security</a><br>
+    2. Generate App Password: <a href="https://myaccount.google.com/apppasswords">https://myaccount.google.com/apppasswords</a><br>
+    3. Use App Password (16 characters) instead of your regular password<br>
+    <b>Settings:</b> smtp.gmail.com, Port 587, TLS enabled<br><br>
+    <b>[COMMON] Common Gmail Issues:</b><br>
+    • <b>Error 535:</b> Wrong username/password - Use App Password<br>
+    • <b>Error 534:</b> App Password required - Enable 2FA first<br>
+    • <b>Still having issues?</b> <a href="https://support.google.com/mail/answer/7126229">Gmail Help</a>
+    """,
+    'Outlook/Hotmail': """
+    <b>[EMAIL] Outlook/Hotmail Configuration:</b><br>
+    1. Enable 2-Step Verification: <a href="https://account.microsoft.com/security">https://account.microsoft.com/security</a><br>
+    2. Generate App Password: <a href="https://account.microsoft.com/security/app-passwords">https://account.microsoft.com/security/app-passwords</a><br>
+    3. Use App Password instead of your regular password<br>
+    <b>Settings:</b> smtp-mail.outlook.com, Port 587, TLS enabled<br><br>
+    <b>[COMMON] Common Outlook Issues:</b><br>
+    • <b>Error 535:</b> Wrong username/password - Use App Password<br>
+    • <b>Error 534:</b> App Password required - Enable 2FA first<br>
+    • <b>Still having issues?</b> <a href="https://support.microsoft.com/en-us/office/pop-imap-and-smtp-settings-for-outlook-8361e398-8af4-4e97-b147-6c6c4ac95353">Outlook Help</a>
+    """,
+    'Office 365': """
+    <b>[EMAIL] Office 365 Configuration:</b><br>
+    1. Contact your IT administrator for SMTP settings<br>
+    2. May require App Password: <a href="https://account.microsoft.com/security/app-passwords">https://account.microsoft.com/security/app-passwords</a><br>
+    3. Some organizations disable SMTP authentication<br>
+    <b>Settings:</b> smtp.office365.com, Port 587, TLS enabled<br><br>
+    <b>[COMMON] Common Office 365 Issues:</b><br>
+    • <b>Error 535:</b> Wrong username/password - Use App Password<br>
+    • <b>Error 550:</b> Authentication failed - Check with IT admin<br>
+    • <b>Still having issues?</b> Contact your IT administrator
+    """,
+    'Custom': """
+    <b>[EMAIL] Custom Email Configuration:</b><br>
+    1. Contact your email provider for SMTP settings<br>
+    2. Common settings: smtp.yourdomain.com, Port 587 or 465<br>
+    3. Check if TLS/SSL is required<br>
+    4. Verify username and password requirements<br><br>
+    <b>[COMMON] Common Custom Issues:</b><br>
+    • <b>Error 535:</b> Wrong username/password - Check credentials<br>
+    • <b>Error 550:</b> Authentication failed - Check SMTP settings<br>
+    • <b>Connection timeout:</b> Check firewall/antivirus settings<br>
+    • <b>Still having issues?</b> Contact your email provider
+    """,
+    '__default__': """
+    <b>[EMAIL] Email Configuration:</b><br>
+    Select an email provider from the dropdown above to see specific configuration instructions.<br><br>
+    <b>Supported Providers:</b><br>
+    • <b>Gmail:</b> Personal Google accounts<br>
+    • <b>Outlook/Hotmail:</b> Personal Microsoft accounts<br>
+    • <b>Office 365:</b> Business Microsoft accounts<br>
+    • <b>Custom:</b> Other email providers
+    """,
+}
+
+# Guide label object names, styled by GUIDE_STYLESHEET in the theme manager
+_SMTP_GUIDE_STYLE: Dict[str, str] = {
+    'Azure (Graph API)': 'GuideAzure',
+    'Gmail': 'GuideInfo',
+    'Outlook/Hotmail': 'GuideWarn',
+    'Office 365': 'GuideSuccess',
+    'Custom': 'GuideTip',
+    '__default__': 'GuideInfo',
+}
+
+
+def _parse_recipients(text: str) -> list:
+    """Return the non-blank, stripped lines of a recipients box."""
+    return [r for r in map(str.strip, text.splitlines()) if r]
+
+
+class _ProgressCoalescer:
+    """Progress callback that forwards at most one message per interval seconds.
+
+    Messages tagged [SUCCESS], [ERROR] or [WARNING] are always forwarded. Any other
+    message arriving too soon is kept, replacing any older kept one, and goes out on
+    the next flush(). _start_flashing flushes from a UI timer while the job runs and
+    _flash_firmware_worker flushes once more on exit, so the last message is not lost.
+    """
+
+    URGENT_TAGS = ("[SUCCESS]", "[ERROR]", "[WARNING]")
+
+    def __init__(self, emit, interval: float = 0.05):
+        self._emit = emit
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._last_emit = 0.0
+        self._pending = None
+
+    def __call__(self, msg):
+        with self._lock:
+            now = time.monotonic()
+            if (now - self._last_emit < self._interval
+                    and not any(tag in msg for tag in self.URGENT_TAGS)):
+                self._pending = msg
+                return
+            self._last_emit = now
+            self._pending = None
+            self._emit(msg)
 
-class DeviceScanWorker(QThread):
-    """Worker thread for device scanning to prevent UI freezing."""
+    def flush(self):
+        with self._lock:
+            if self._pending is None:
+                return
+            msg, self._pending = self._pending, None
+            self._last_emit = time.monotonic()
+            self._emit(msg)
+
+
+class DeviceScanSignals(QObject):
+    """Signals emitted by DeviceScanRunnable (QRunnable cannot own signals)."""
     scan_finished = Signal(list)
 
+
+class DeviceScanRunnable(QRunnable):
+    """Thread pool task for device scanning to prevent UI freezing."""
+
     def __init__(self, device_detector):
         super().__init__()
         self.device_detector = device_detector
+        self.signals = DeviceScanSignals()
+
+    def run(self):
+        try:
+            devices = self.device_detector.detect_devices()
+        except Exception as e:
+            logger.warning(f"Device scan failed: {e}")
+            devices = []
+        self.signals.scan_finished.emit(devices)
+
+
+def _bundle_logs(logs_dir, zip_path):
+    """Zip the *.log files in logs_dir into zip_path; returns zip_path, or None if it could not be built.
+
+    Uses the fastest deflate level: logs shrink nearly as much as at the default level for a fraction of the CPU.
+    """
+    try:
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            if logs_dir.exists():
+                for p in logs_dir.glob('*.log'):
+                    zf.write(p, arcname=p.name)
+        return zip_path if zip_path.exists() else None
+    except Exception as e:
+        logger.warning(f"Failed to build logs zip: {e}")
+        return None
+
+
+class PoolTaskSignals(QObject):
+    """Signals emitted by PoolTask."""
+    finished = Signal(object)  # task return value
+    error = Signal(str)
+    progress = Signal(str)  # Optional status messages emitted by the task
+
+
+class PoolTask(QRunnable):
+    """Run a callable on the global QThreadPool and report its result via signals."""
+
+    def __init__(self, task, *args, **kwargs):
+        super().__init__()
+        self.task = task
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = PoolTaskSignals()
 
     def run(self):
-        devices = self.device_detector.detect_devices()
-        self.scan_finished.emit(devices)
+        try:
+            result = self.task(*self.args, **self.kwargs)
+            self.signals.finished.emit(result)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class DeviceTableModel(QAbstractTableModel):
+    """Read-only table model over rows of display strings, for device listings in dialogs."""
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = []
+        self._backgrounds = {}  # (row, column) -> QBrush
+
+    def set_rows(self, rows, backgrounds=None):
+        """Replace all rows; backgrounds maps (row, column) to a QBrush."""
+        self.beginResetModel()
+        self._rows = rows
+        self._backgrounds = backgrounds or {}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.BackgroundRole:
+            return self._backgrounds.get((index.row(), index.column()))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
 
 
 class WorkerThread(QThread):
-    """Worker thread for background operations."""
+    """Dedicated thread for long-running jobs such as flashing; short tasks use PoolTask."""
     succeeded = Signal()
     error = Signal(str)
-    device_connected = Signal(object)  # Device object
-    device_disconnected = Signal(object)  # Device object
+    progress = Signal(str)  # Optional status messages emitted by the task
     
     def __init__(self, task, *args, **kwargs):
         super().__init__()
@@ -83,6 +388,24 @@ class WorkerThread(QThread):
             self.error.emit(str(e))
 
 
+class DeviceChangeFilter(QAbstractNativeEventFilter):
+    """Wakes the device detector on Windows WM_DEVICECHANGE broadcasts."""
+    WM_DEVICECHANGE = 0x0219
+    # DBT_DEVNODES_CHANGED, DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE
+    DEVICE_EVENTS = (0x0007, 0x8000, 0x8004)
+
+    def __init__(self, detector):
+        super().__init__()
+        self.detector = detector
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == self.WM_DEVICECHANGE and msg.wParam in self.DEVICE_EVENTS:
+                self.detector.notify_hotplug()
+        return False, 0
+
+
 class BadgedButton(QPushButton):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -121,9 +444,75 @@ class BadgedButton(QPushButton):
             painter.drawText(x, y, size, size, Qt.AlignCenter, str(self.badge_count))
 
 class MainWindow(QMainWindow):
+    # Emitted from the monitoring thread; delivered queued on the GUI thread
+    device_change_detected = Signal(str, object)
+
+    # Progress text from the email worker thread (queued onto the GUI thread)
+    email_progress = Signal(str)
+
+    # Trailing window used to coalesce bursts of hotplug events into one scan
+    REFRESH_DEBOUNCE_MS = 150
+    SCAN_STATUS_DELAY_MS = 100
+    GUIDE_DEBOUNCE_MS = 250
+    # How often a held-back flash progress message is pushed to the dialog
+    PROGRESS_FLUSH_MS = 50
+    PREVIEW_DEBOUNCE_MS = 50
+    # Search-as-you-type delay and how many recent queries a search dialog remembers
+    SEARCH_DEBOUNCE_MS = 150
+    # Filter box keystrokes within this window collapse into one table update
+    FILTER_DEBOUNCE_MS = 150
+    # Footer clock fires this long after each minute boundary so it never lands just before it
+    CLOCK_TICK_SLACK_MS = 50
+    SEARCH_CACHE_SIZE = 32
+    # Window for coalescing settings saves into one config write
+    CONFIG_SAVE_DEBOUNCE_MS = 500
+    # Machines added to the OneDrive history list per scroll-triggered batch
+    MACHINE_HISTORY_PAGE = 50
+
+    # Result label styles, shared so unchanged states can skip setStyleSheet
+    _STYLE_RESULT_NEUTRAL = "color: #666; font-size: 12px; padding: 10px; border: 1px solid #ccc; border-radius: 5px;"
+    _STYLE_RESULT_OK = "color: green; font-size: 12px; padding: 10px; border: 1px solid #ccc; border-radius: 5px;"
+    _STYLE_RESULT_ERR = "color: red; font-size: 12px; padding: 10px; border: 1px solid #ccc; border-radius: 5px;"
+    _STYLE_ONEDRIVE_OK = "color:#0f5132;font-size:12px;padding:10px;border:1px solid #badbcc;border-radius:6px;background:#d1e7dd;"
+    _STYLE_ONEDRIVE_ERR = "color:#842029;font-size:12px;padding:10px;border:1px solid #f5c2c7;border-radius:6px;background:#f8d7da;"
+    _STYLE_PREVIEW = "color: #666; font-style: italic;"
+    _STYLE_PREVIEW_INVALID = "color: red; font-style: italic;"
+
+    # Untranslated example placeholders shared by the dialogs
+    _PH_PHONE = "+212 6 12 34 56 78"
+    _PH_EMAIL = "your.email@gmail.com"
+    _PH_SMTP_HOST = "e.g., smtp.gmail.com"
+    _PH_FIRMWARE_VERSION = "1.0.0"
+    _PH_MACHINE_NAME = "e.g., NewMachine"
+    _PH_MACHINE_PREFIX = "e.g., NM-"
+    _PH_ONEDRIVE_FOLDER = "e.g., C:\\Users\\Username\\OneDrive\\SharedFolder"
+    _PH_USER_FOLDER = "e.g., JohnDoe_Work"
+    _PH_SEARCH = "Enter search query..."
+
+    # Host contacted first by the GitLab firmware source
+    _GITLAB_WARMUP_URL = "https://gitlab.com"
+    # Percentage at the end of a flasher progress message, e.g. "Downloading: 42.0%"
+    _PERCENT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%\s*$")
+
     BUTTON_FONT_PT = 8
     TABLE_FONT_PT = 8
     HEADER_FONT_PT = 8
+
+    # Shared paint resources; built once instead of per widget/row
+    _TITLE_FONT = QFont("Arial", 12, QFont.Bold)
+    _MENU_BUTTON_FONT = QFont("Segoe UI", 10, QFont.Bold)
+    _BRUSH_GREEN = QBrush(Qt.green)
+    _BRUSH_YELLOW = QBrush(Qt.yellow)
+    _BRUSH_RED = QBrush(Qt.red)
+    # Health score bands, highest threshold first: (threshold, cell brush, label style)
+    _HEALTH_BANDS = (
+        (80, _BRUSH_GREEN, "color: green;"),
+        (60, _BRUSH_YELLOW, "color: orange;"),
+        (0, _BRUSH_RED, "color: red;"),
+    )
+    _BRUSH_CHECKED = QBrush(QColor("#dbeafe"))  # light blue
+    _ICON_CACHE: Dict[str, QIcon] = {}  # asset file name -> icon, filled by _icon()
+    _BRUSH_CLEAR = QBrush(Qt.transparent)
     COUNTRY_NAMES = {
         "FR": "France",
         "MA": "Morocco",
@@ -147,10 +536,56 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.config = Config.load_config()
+        # Suffix validators keyed by (prefix, length); patterns never change for a key
+        self._validator_cache = {}
+        self._refresh_machine_types_cache()
+        self._refresh_settings_cache()
         self.devices = []
         self.device_history = []
         self.last_report_path = None  # Store last generated report path
+        # Known at generation time; the watcher flips it if the file is removed
+        self._last_report_exists = False
+        self._report_watcher = QFileSystemWatcher(self)
+        self._report_watcher.fileChanged.connect(self._on_report_file_changed)
+        self._email_dialog = None  # Built lazily by configure_email_dialog
+        # Incremental device table state: port -> row, port -> rendered values
+        self._row_by_port = {}
+        self._row_snapshots = {}
+        # Control-panel (button, icon file) pairs; attached after the first paint
+        self._pending_icons = []
         self.setup_ui()
+        QTimer.singleShot(0, self, self._attach_icons)
+
+        # Debounced refresh for device change storms (e.g. a hub enumerating)
+        self._refresh_debounce_timer = QTimer(self)
+        self._refresh_debounce_timer.setSingleShot(True)
+        self._refresh_debounce_timer.setInterval(self.REFRESH_DEBOUNCE_MS)
+        self._refresh_debounce_timer.timeout.connect(self.refresh_devices)
+        # "Scanning..." only paints if a scan is still running after SCAN_STATUS_DELAY_MS
+        self._scan_status_timer = QTimer(self)
+        self._scan_status_timer.setSingleShot(True)
+        self._scan_status_timer.setInterval(self.SCAN_STATUS_DELAY_MS)
+        self._scan_status_timer.timeout.connect(
+            lambda: self._show_status(QCoreApplication.translate("MainWindow", "Scanning for devices..."))
+        )
+        self.device_change_detected.connect(self._on_device_change_detected)
+        self._email_worker = None
+        self._pool_tasks = set()  # PoolTasks kept alive until they report back
+        self._last_saved_config = None  # JSON of the config last written by _flush_config
+        self._config_write_lock = threading.Lock()  # Serialises config writes from the pool and the GUI thread
+        self._config_save_generation = 0  # Bumped for every config snapshot handed to a writer
+        self._config_written_generation = 0  # Generation of the snapshot last written to disk
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(self.CONFIG_SAVE_DEBOUNCE_MS)
+        self._config_save_timer.timeout.connect(self._flush_config)
+        self._warmed_origins = set()  # Hosts already pre-connected in the firmware HTTP session
+        self._machine_history_pending = iter(())  # Machines not yet added to machine_history_list
+        self._machine_history_request = None  # Token of the latest OneDrive machine listing
+        self._history_dialog = None  # Built on first show_device_history_dialog, then reused
+        self._details_labels = None  # Translated _device_details_text labels; reset by update_ui_text
+        self._filter_index = None  # (devices list, [(device, lowercase haystack)]) for apply_device_filter
+        self.email_progress.connect(self._on_email_progress, Qt.QueuedConnection)
         self.uid_loading_dialog = None
         
         # Initialize theme manager
@@ -173,13 +608,17 @@ class MainWindow(QMainWindow):
         # Footer UI: devices count, localized date/time with UTC offset, and location/timezone
         try:
             # Devices count (left-most)
+            # The labels share one container, so the status bar lays out and styles them once
+            footer = QWidget()
+            footer.setStyleSheet("QLabel { color: #888; font-size: 11px; }")
+            footer_layout = QHBoxLayout(footer)
+            footer_layout.setContentsMargins(0, 0, 0, 0)
             self.footer_devices_label = QLabel()
             self.footer_clock_label = QLabel()
             self.footer_geo_label = QLabel()
-            style = "color: #888; font-size: 11px;"
-            self.footer_devices_label.setStyleSheet(style)
-            self.footer_clock_label.setStyleSheet(style)
-            self.footer_geo_label.setStyleSheet(style)
+            for label in (self.footer_devices_label, self.footer_clock_label, self.footer_geo_label):
+                label.setTextFormat(Qt.PlainText)
+                footer_layout.addWidget(label)
 
             # Initial render
             self._update_footer_devices()
@@ -188,16 +627,12 @@ class MainWindow(QMainWindow):
 
             # Show devices count in status bar (left-most)
             self.footer_devices_label.setVisible(True)
-            sb = self._sb()
-            sb.addPermanentWidget(self.footer_devices_label)
-            sb.addPermanentWidget(self.footer_clock_label)
-            sb.addPermanentWidget(self.footer_geo_label)
+            self._sb().addPermanentWidget(footer)
 
-            # Update clock every second
+            # The clock shows minutes; it re-arms itself for the next minute while the window is shown
             self._clock_timer = QTimer(self)
-            self._clock_timer.setInterval(1000)
+            self._clock_timer.setSingleShot(True)
             self._clock_timer.timeout.connect(self._update_footer_clock)
-            self._clock_timer.start()
         except Exception as e:
             logger.warning(f"Failed to initialize improved footer UI: {e}")
         
@@ -235,15 +670,13 @@ class MainWindow(QMainWindow):
     def _init_services(self):
         try:
             self.device_detector = DeviceDetector()
-            self.report_generator = ReportGenerator()
-            self.email_sender = EmailSender()
-            self.firmware_flasher = FirmwareFlasher()
-            self.onedrive_manager = OneDriveManager()
+            # Report, email, flashing and OneDrive services are created on first use
             self.app_updater = AppUpdater()
             try:
                 self.device_detector.start_real_time_monitoring(self._device_change_callback)
             except Exception:
                 pass
+            self._install_device_change_filter()
             try:
                 self._update_onedrive_status_indicator()
             except Exception:
@@ -251,6 +684,41 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.warning(f"Service initialization deferred error: {e}")
     
+    def _install_device_change_filter(self):
+        """Let Windows device notifications wake the detector instead of waiting for a poll."""
+        if sys.platform != "win32":
+            return
+        try:
+            app = QApplication.instance()
+            if getattr(self, '_device_change_filter', None) is not None:
+                app.removeNativeEventFilter(self._device_change_filter)
+            self._device_change_filter = DeviceChangeFilter(self.device_detector)
+            app.installNativeEventFilter(self._device_change_filter)
+            self.device_detector.notify_hotplug("WM_DEVICECHANGE")
+        except Exception as e:
+            logger.warning(f"Device change notifications unavailable, polling only: {e}")
+
+    # Heavy services (openpyxl, msal/keyring, flashing tools) load on first access
+    @cached_property
+    def report_generator(self):
+        from ..core.report_generator import ReportGenerator
+        return ReportGenerator()
+
+    @cached_property
+    def email_sender(self):
+        from ..core.email_sender import EmailSender
+        return EmailSender()
+
+    @cached_property
+    def firmware_flasher(self):
+        from ..core.firmware_flasher import FirmwareFlasher
+        return FirmwareFlasher()
+
+    @cached_property
+    def onedrive_manager(self):
+        from ..core.onedrive_manager import OneDriveManager
+        return OneDriveManager()
+
     def setup_ui(self):
         """Set up the user interface."""
         self.setWindowTitle(QCoreApplication.translate("MainWindow", "AWG Kumulus Device Manager v1.0.0"))
@@ -333,27 +801,34 @@ class MainWindow(QMainWindow):
         """Handle application close event."""
         # Check for pending emails if offline
         try:
-            if hasattr(self, 'email_sender') and hasattr(self.email_sender, 'queue_manager'):
-                pending = self.email_sender.queue_manager.get_pending_emails()
-                if pending and not check_internet_connection():
-                    reply = QMessageBox.question(
-                        self,
-                        QCoreApplication.translate("MainWindow", "Unsent Emails"),
-                        QCoreApplication.translate("MainWindow", 
-                            "You have {count} unsent emails and no internet connection.\n"
-                            "These emails are saved and will be sent automatically when you restart the app with an internet connection.\n\n"
-                            "Do you want to close the application now?"
-                        ).format(count=len(pending)),
-                        QMessageBox.Yes | QMessageBox.No,
-                        QMessageBox.No
-                    )
-                    
-                    if reply == QMessageBox.No:
-                        event.ignore()
-                        return
+            pending = self._pending_queued_emails()
+            if pending and not check_internet_connection():
+                reply = QMessageBox.question(
+                    self,
+                    QCoreApplication.translate("MainWindow", "Unsent Emails"),
+                    QCoreApplication.translate("MainWindow", 
+                        "You have {count} unsent emails and no internet connection.\n"
+                        "These emails are saved and will be sent automatically when you restart the app with an internet connection.\n\n"
+                        "Do you want to close the application now?"
+                    ).format(count=len(pending)),
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.No
+                )
+                
+                if reply == QMessageBox.No:
+                    event.ignore()
+                    return
 
         except Exception as e:
             logger.error(f"Error in closeEvent: {e}")
+        
+        # Write any settings change still waiting in the save debounce window or on the pool
+        if (self._config_save_timer.isActive()
+                or self._config_written_generation != self._config_save_generation):
+            try:
+                self._save_config_now()
+            except Exception as e:
+                logger.error(f"Failed to save configuration: {e}")
             
         super().closeEvent(event)
 
@@ -364,14 +839,18 @@ class MainWindow(QMainWindow):
         
         # Title
         title = QLabel(QCoreApplication.translate("MainWindow", "Connected Devices"))
-        title.setFont(QFont("Arial", 12, QFont.Bold))
+        title.setFont(MainWindow._TITLE_FONT)
         layout.addWidget(title)
         
         # Filters
         filter_layout = QHBoxLayout()
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText(QCoreApplication.translate("MainWindow", "Filter devices"))
-        self.filter_input.textChanged.connect(self.apply_device_filter)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.apply_device_filter)
+        self.filter_input.textChanged.connect(lambda _: self._filter_timer.start())
         filter_layout.addWidget(self.filter_input)
         self.filter_type_combo = QComboBox()
         self.filter_type_combo.addItem(QCoreApplication.translate("MainWindow", "All"))
@@ -431,6 +910,10 @@ class MainWindow(QMainWindow):
         self.device_table.setSelectionBehavior(QTableWidget.SelectRows)
         self.device_table.setSelectionMode(QTableWidget.SingleSelection)
         self.device_table.setSortingEnabled(True)
+        # Header sorts move rows; keep the row->device mapping in step
+        self.device_table.horizontalHeader().sortIndicatorChanged.connect(
+            lambda *_: self._sync_device_rows()
+        )
         try:
             from PySide6.QtWidgets import QStyledItemDelegate
             # Keep chip-style delegate for Status column only (column 5)
@@ -474,7 +957,7 @@ class MainWindow(QMainWindow):
                 btn.setObjectName(obj_name)
             # Apply font (assuming _apply_button_font exists or just standard)
             try:
-                btn.setFont(QFont("Segoe UI", 10, QFont.Bold))
+                btn.setFont(MainWindow._MENU_BUTTON_FONT)
             except: pass
             
             try:
@@ -549,8 +1032,10 @@ class MainWindow(QMainWindow):
                 'sync_enabled': True, 'auto_create_folders': True
             })
             # Persist
-            Config.save_config(cfg)
+            self._save_config_now(cfg)
             self.config = cfg
+            self._refresh_machine_types_cache()
+            self._refresh_settings_cache()
             
             # Inform user and suggest next steps
             msg = QCoreApplication.translate('Dialogs', 'App data initialized successfully.')
@@ -676,44 +1161,28 @@ class MainWindow(QMainWindow):
         header_row.addStretch(1)
         
         self.btn_manual_icon = QPushButton()
-        try:
-            self.btn_manual_icon.setIcon(self._icon("user-guide.png"))
-            self.btn_manual_icon.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((self.btn_manual_icon, "user-guide.png"))
         self.btn_manual_icon.setToolTip(QCoreApplication.translate("MainWindow", "UserManual"))
         self.btn_manual_icon.clicked.connect(self.open_user_manual_current_lang)
         self.btn_manual_icon.setFixedSize(QSize(32, 32))
         header_row.addWidget(self.btn_manual_icon)
         
         self.btn_support_icon = QPushButton()
-        try:
-            self.btn_support_icon.setIcon(self._icon("customer-service.png"))
-            self.btn_support_icon.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((self.btn_support_icon, "customer-service.png"))
         self.btn_support_icon.setToolTip(QCoreApplication.translate("MainWindow", "Support"))
         self.btn_support_icon.clicked.connect(self.show_contact_support_dialog)
         self.btn_support_icon.setFixedSize(QSize(32, 32))
         header_row.addWidget(self.btn_support_icon)
         
         self.btn_tour_icon = QPushButton()
-        try:
-            self.btn_tour_icon.setIcon(self._icon("Quicktour.png"))
-            self.btn_tour_icon.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((self.btn_tour_icon, "Quicktour.png"))
         self.btn_tour_icon.setToolTip(QCoreApplication.translate("MainWindow", "Quick Tour"))
         self.btn_tour_icon.clicked.connect(self.show_quick_tour_dialog)
         self.btn_tour_icon.setFixedSize(QSize(32, 32))
         header_row.addWidget(self.btn_tour_icon)
         
         self.btn_update_icon = BadgedButton()
-        try:
-            self.btn_update_icon.setIcon(self._icon("update.png"))
-            self.btn_update_icon.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((self.btn_update_icon, "update.png"))
         self.btn_update_icon.setToolTip(QCoreApplication.translate("MainWindow", "Check for Updates"))
         self.btn_update_icon.setObjectName("btn_check_updates")
         self.btn_update_icon.clicked.connect(self.check_for_updates)
@@ -739,7 +1208,7 @@ class MainWindow(QMainWindow):
         form_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "Email:")), self.operator_email)
         
         self.operator_phone = QLineEdit()
-        self.operator_phone.setPlaceholderText("+212 6 12 34 56 78")
+        self.operator_phone.setPlaceholderText(self._PH_PHONE)
         self.operator_phone.setText(self.config.get('operator', {}).get('phone', ''))
         self.operator_phone.setMinimumHeight(32)
         self.operator_phone.setStyleSheet("QLineEdit { padding: 4px; }")
@@ -807,10 +1276,8 @@ class MainWindow(QMainWindow):
 
         self.machine_type = QComboBox()
         self.update_machine_type_combo()
-        machine_type_idx = list(Config.get_machine_types(self.config).keys()).index(
-            self.config.get('machine_type', 'Amphore')
-        )
-        self.machine_type.setCurrentIndex(machine_type_idx)
+        machine_type_idx = self.machine_type.findText(self.config.get('machine_type', 'Amphore'))
+        self.machine_type.setCurrentIndex(machine_type_idx if machine_type_idx >= 0 else 0)
         self.machine_type.currentTextChanged.connect(self.on_machine_type_changed)
         machine_form.addRow(QLabel(QCoreApplication.translate("MainWindow", "Machine Type:")), self.machine_type)
         
@@ -874,11 +1341,7 @@ class MainWindow(QMainWindow):
         refresh_btn.setStyleSheet(primary_button_style())
         self._apply_button_font(refresh_btn)
         refresh_btn.setMinimumHeight(44)
-        try:
-            refresh_btn.setIcon(self._icon("rotation.png"))
-            refresh_btn.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((refresh_btn, "rotation.png"))
         refresh_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         button_layout.addWidget(refresh_btn, 0, 0)
         self.refresh_btn = refresh_btn  # Store as instance variable for translation
@@ -889,11 +1352,7 @@ class MainWindow(QMainWindow):
         history_btn.setStyleSheet(primary_button_style())
         self._apply_button_font(history_btn)
         history_btn.setMinimumHeight(44)
-        try:
-            history_btn.setIcon(self._icon("history.png"))
-            history_btn.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((history_btn, "history.png"))
         history_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         button_layout.addWidget(history_btn, 0, 1)
         self.history_btn = history_btn  # Store as instance variable for translation
@@ -905,11 +1364,7 @@ class MainWindow(QMainWindow):
         email_btn.setStyleSheet(primary_button_style())
         self._apply_button_font(email_btn)
         email_btn.setMinimumHeight(44)
-        try:
-            email_btn.setIcon(self._icon("mail.png"))
-            email_btn.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((email_btn, "mail.png"))
         email_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         button_layout.addWidget(email_btn, 1, 0)
         self.email_btn = email_btn  # Store as instance variable for translation
@@ -921,11 +1376,7 @@ class MainWindow(QMainWindow):
         flash_btn.setStyleSheet(primary_button_style())
         self._apply_button_font(flash_btn)
         flash_btn.setMinimumHeight(44)
-        try:
-            flash_btn.setIcon(self._icon("flash.png"))
-            flash_btn.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((flash_btn, "flash.png"))
         flash_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         button_layout.addWidget(flash_btn, 1, 1)
         self.flash_btn = flash_btn  # Store as instance variable for translation
@@ -939,11 +1390,7 @@ class MainWindow(QMainWindow):
         read_uid_btn.setStyleSheet(primary_button_style())
         self._apply_button_font(read_uid_btn)
         read_uid_btn.setMinimumHeight(44)
-        try:
-            read_uid_btn.setIcon(self._icon("search.png"))  # reusing search icon or any other
-            read_uid_btn.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((read_uid_btn, "search.png"))
         read_uid_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         button_layout.addWidget(read_uid_btn, 2, 0)
         self.read_uid_btn = read_uid_btn
@@ -956,11 +1403,7 @@ class MainWindow(QMainWindow):
         open_stm32_btn.setStyleSheet(primary_button_style())
         self._apply_button_font(open_stm32_btn)
         open_stm32_btn.setMinimumHeight(44)
-        try:
-            open_stm32_btn.setIcon(self._icon("source-code.png"))
-            open_stm32_btn.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((open_stm32_btn, "source-code.png"))
         open_stm32_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         button_layout.addWidget(open_stm32_btn, 2, 1)
         self.open_stm32_btn = open_stm32_btn  # Store for translation
@@ -973,11 +1416,7 @@ class MainWindow(QMainWindow):
         settings_btn.setStyleSheet(primary_button_style())
         self._apply_button_font(settings_btn)
         settings_btn.setMinimumHeight(44)
-        try:
-            settings_btn.setIcon(self._icon("setting.png"))
-            settings_btn.setIconSize(QSize(20, 20))
-        except Exception:
-            pass
+        self._pending_icons.append((settings_btn, "setting.png"))
         settings_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         button_layout.addWidget(settings_btn, 3, 0)
         self.settings_btn = settings_btn
@@ -1020,41 +1459,56 @@ class MainWindow(QMainWindow):
         af['board_types'] = types
         cfg['auto_flash'] = af
         try:
-            from src.core.config import Config as _C
-            _C.save_config(cfg)
+            self._save_config_now(cfg)
             self._show_status(QCoreApplication.translate("MainWindow", "Auto-Flash settings saved"))
         except Exception:
             pass
 
+    def _attach_icons(self):
+        """Set the control-panel icons deferred by create_control_panel."""
+        for button, filename in self._pending_icons:
+            try:
+                button.setIcon(self._icon(filename))
+                button.setIconSize(QSize(20, 20))
+            except Exception:
+                pass
+        self._pending_icons = []
+
     def _icon(self, filename: str) -> QIcon:
-        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-             base = Path(sys._MEIPASS)
-             p = base / "src" / "assets" / filename
-        else:
-             p = Path(__file__).resolve().parent.parent / "assets" / filename
-        return QIcon(str(p))
+        """Return the QIcon for an asset file, loading each file once per process."""
+        icon = MainWindow._ICON_CACHE.get(filename)
+        if icon is None:
+            icon = MainWindow._ICON_CACHE[filename] = QIcon(str(_ICON_DIR / filename))
+        return icon
     
     def refresh_devices(self):
         """Refresh the device list."""
-        if hasattr(self, 'scan_worker') and self.scan_worker and self.scan_worker.isRunning():
+        if getattr(self, '_scan_in_progress', False):
             logger.info("Scan already in progress, queuing next scan")
             self._pending_refresh = True
             return
 
-        self._show_status(QCoreApplication.translate("MainWindow", "Scanning for devices..."))
+        self._scan_status_timer.start()
         
         # Disable refresh button
         if hasattr(self, 'refresh_btn'):
             self.refresh_btn.setEnabled(False)
             self.refresh_btn.setText(QCoreApplication.translate("MainWindow", "Scanning..."))
             
-        self.scan_worker = DeviceScanWorker(self.device_detector)
-        self.scan_worker.scan_finished.connect(self._on_scan_finished)
-        self.scan_worker.start()
+        self._scan_in_progress = True
+        runnable = DeviceScanRunnable(self.device_detector)
+        # Keep the signals object alive until the result is delivered
+        self._scan_signals = runnable.signals
+        self._scan_signals.scan_finished.connect(self._on_scan_finished)
+        QThreadPool.globalInstance().start(runnable)
 
     def _on_scan_finished(self, devices):
         """Handle scan completion."""
+        self._scan_in_progress = False
+        self._scan_signals = None
+        self._scan_status_timer.stop()
         self.devices = devices
+        self._filter_index = None
         self.filtered_devices = list(self.devices)
         try:
             types = sorted({d.board_type.value for d in self.devices})
@@ -1089,71 +1543,116 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
     
-    def update_device_table(self):
-        """Update the device table with current devices."""
-        devices = getattr(self, 'filtered_devices', self.devices)
-        self.device_table.setRowCount(len(devices))
-        
-        for row, device in enumerate(devices):
-            # Load UID checkbox
-            checkbox_item = QTableWidgetItem()
-            checkbox_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            checkbox_item.setCheckState(Qt.Unchecked)
-            checkbox_item.setToolTip(QCoreApplication.translate("MainWindow", "Check to load UID from board"))
-            self.device_table.setItem(row, 0, checkbox_item)
-
-            # Port
-            it = QTableWidgetItem(device.port)
-            it.setToolTip(QCoreApplication.translate("MainWindow", "Click to copy. Right-click for options."))
-            self.device_table.setItem(row, 1, it)
-            
-            # Type
-            board_type = device.board_type.value
-            it = QTableWidgetItem(board_type)
-            it.setToolTip(QCoreApplication.translate("MainWindow", "Click to copy. Right-click for options."))
-            self.device_table.setItem(row, 2, it)
+    def _format_last_seen(self, device: Device) -> str:
+        """Return a short relative 'last seen' label for a device."""
+        if not device.last_seen:
+            return QCoreApplication.translate("MainWindow", "Never")
+        dt = QDateTime.fromString(device.last_seen, Qt.ISODate)
+        if not dt.isValid():
+            return device.last_seen_date
+        secs = dt.secsTo(QDateTime.currentDateTime())
+        if secs < 60:
+            return QCoreApplication.translate("MainWindow", "Just now")
+        if secs < 3600:
+            return QCoreApplication.translate("MainWindow", "{} min ago").format(secs//60)
+        if secs < 86400:
+            return QCoreApplication.translate("MainWindow", "{} h ago").format(secs//3600)
+        return dt.date().toString(QLocale().dateFormat(QLocale.ShortFormat))
+
+    def _device_row_snapshot(self, device: Device) -> tuple:
+        """Values rendered in columns 1-6 for a device, plus the UID tooltip."""
+        return (
+            device.port,
+            device.board_type.value,
+            str(device.uid or "—"),
+            getattr(device, 'firmware_version', None) or "-",
+            device.status,
+            self._format_last_seen(device),
+            self._device_details_text(device),
+        )
 
-            # UID (column 3)
-            uid_val = device.uid
-            if not uid_val:
-                uid_val = "—"
-            it = QTableWidgetItem(str(uid_val))
-            it.setToolTip(self._device_details_text(device))
-            self.device_table.setItem(row, 3, it)
+    def _fill_device_row(self, row: int, snap: tuple):
+        """Create the items for a freshly allocated device row."""
+        # Load UID checkbox
+        checkbox_item = QTableWidgetItem()
+        checkbox_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+        checkbox_item.setCheckState(Qt.Unchecked)
+        checkbox_item.setToolTip(QCoreApplication.translate("MainWindow", "Check to load UID from board"))
+        self.device_table.setItem(row, 0, checkbox_item)
+
+        copy_tip = QCoreApplication.translate("MainWindow", "Click to copy. Right-click for options.")
+        for col, text in enumerate(snap[:6], start=1):
+            it = QTableWidgetItem(text)
+            it.setToolTip(snap[6] if col == 3 else copy_tip)
+            self.device_table.setItem(row, col, it)
+
+    def _sync_device_rows(self):
+        """Rebuild the port->row index and keep the device list in table row order."""
+        self._row_by_port = {}
+        for row in range(self.device_table.rowCount()):
+            item = self.device_table.item(row, 1)
+            if item:
+                self._row_by_port[item.text()] = row
+        devices = getattr(self, 'filtered_devices', self.devices)
+        last = len(self._row_by_port)
+        devices.sort(key=lambda d: self._row_by_port.get(d.port, last))
 
-            # Firmware (column 4)
-            fw = getattr(device, 'firmware_version', None) or "-"
-            it = QTableWidgetItem(fw)
-            it.setToolTip(QCoreApplication.translate("MainWindow", "Click to copy. Right-click for options."))
-            self.device_table.setItem(row, 4, it)
+    def update_device_table(self):
+        """Update the device table with current devices, touching only changed rows."""
+        devices = getattr(self, 'filtered_devices', self.devices)
+        new_snap = {d.port: self._device_row_snapshot(d) for d in devices}
 
-            # Status (column 5)
-            status_item = QTableWidgetItem(device.status)
-            status_item.setToolTip(QCoreApplication.translate("MainWindow", "Click to copy. Right-click for options."))
-            self.device_table.setItem(row, 5, status_item)
+        table = self.device_table
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            # Rows must not move while we address them by index
+            table.setSortingEnabled(False)
+
+            # Drop rows for devices that are gone (bottom-up keeps indices valid)
+            stale = [port for port in self._row_by_port if port not in new_snap]
+            for row in sorted((self._row_by_port[p] for p in stale), reverse=True):
+                table.removeRow(row)
+            for port in stale:
+                self._row_snapshots.pop(port, None)
+            if stale:
+                self._sync_device_rows()
+
+            # Allocate all new rows with one resize rather than insertRow per device
+            added = [port for port in new_snap if port not in self._row_by_port]
+            if added:
+                first = table.rowCount()
+                table.setRowCount(first + len(added))
+                for row, port in enumerate(added, start=first):
+                    self._fill_device_row(row, new_snap[port])
+                    self._row_by_port[port] = row
+                    self._row_snapshots[port] = new_snap[port]
+
+            for port, snap in new_snap.items():
+                old = self._row_snapshots.get(port)
+                if old == snap:
+                    continue
+                row = self._row_by_port[port]
+                for col in range(1, 7):
+                    if old is None or old[col - 1] != snap[col - 1]:
+                        it = table.item(row, col)
+                        if it is None:
+                            it = QTableWidgetItem()
+                            table.setItem(row, col, it)
+                        it.setText(snap[col - 1])
+                uid_item = table.item(row, 3)
+                if uid_item is not None:
+                    uid_item.setToolTip(snap[6])
+                self._row_snapshots[port] = snap
+        finally:
+            table.setSortingEnabled(sorting)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+        # Re-enabling sorting may have reordered rows
+        self._sync_device_rows()
 
-            # Last Seen (column 6)
-            if device.last_seen:
-                dt = QDateTime.fromString(device.last_seen, Qt.ISODate)
-                if dt.isValid():
-                    secs = dt.secsTo(QDateTime.currentDateTime())
-                    if secs < 60:
-                        ls = QCoreApplication.translate("MainWindow", "Just now")
-                    elif secs < 3600:
-                        ls = QCoreApplication.translate("MainWindow", "{} min ago").format(secs//60)
-                    elif secs < 86400:
-                        ls = QCoreApplication.translate("MainWindow", "{} h ago").format(secs//3600)
-                    else:
-                        ls = dt.date().toString(QLocale().dateFormat(QLocale.ShortFormat))
-                else:
-                    ls = device.last_seen.split('T')[0]
-            else:
-                ls = QCoreApplication.translate("MainWindow", "Never")
-            # Last Seen (column 6)
-            it = QTableWidgetItem(ls)
-            it.setToolTip(QCoreApplication.translate("MainWindow", "Click to copy. Right-click for options."))
-            self.device_table.setItem(row, 6, it)
-        
         if devices:
             current_row = self.device_table.currentRow()
             target_row = current_row if 0 <= current_row < len(devices) else 0
@@ -1226,30 +1725,25 @@ class MainWindow(QMainWindow):
         if sb:
             sb.showMessage(text)
     def _device_details_text(self, device: Device) -> str:
-        def _fmt_hex(val):
-            try:
-                if val is None:
-                    return None
-                if isinstance(val, int):
-                    return f"0x{val:04X}"
-                s = str(val).strip()
-                if s.lower().startswith("0x"):
-                    return f"0x{int(s,16):04X}"
-                return f"0x{int(s):04X}"
-            except Exception:
-                return str(val)
-        lines = [
-            f"{QCoreApplication.translate('MainWindow', 'UID')}: {device.uid or 'N/A'}",
-            f"{QCoreApplication.translate('MainWindow', 'Chip ID')}: {device.chip_id or 'N/A'}",
-            f"{QCoreApplication.translate('MainWindow', 'MAC')}: {device.mac_address or 'N/A'}",
-            f"{QCoreApplication.translate('MainWindow', 'Firmware')}: {device.firmware_version or 'N/A'}",
-            f"{QCoreApplication.translate('MainWindow', 'Hardware')}: {device.hardware_version or 'N/A'}",
-            f"{QCoreApplication.translate('MainWindow', 'Flash')}: {device.flash_size or 'N/A'}",
-            f"{QCoreApplication.translate('MainWindow', 'CPU')}: {device.cpu_frequency or 'N/A'}",
-            f"{QCoreApplication.translate('MainWindow', 'Serial')}: {device.serial_number or 'N/A'}",
-            f"{QCoreApplication.translate('MainWindow', 'Manufacturer')}: {device.manufacturer or 'N/A'}",
-            f"VID:PID: {_fmt_hex(device.vid)}:{_fmt_hex(device.pid)}" if device.vid and device.pid else "VID:PID: N/A",
-        ]
+        # Built for every row on each table update, so the labels are translated once per language
+        if self._details_labels is None:
+            self._details_labels = (
+                QCoreApplication.translate('MainWindow', 'UID'),
+                QCoreApplication.translate('MainWindow', 'Chip ID'),
+                QCoreApplication.translate('MainWindow', 'MAC'),
+                QCoreApplication.translate('MainWindow', 'Firmware'),
+                QCoreApplication.translate('MainWindow', 'Hardware'),
+                QCoreApplication.translate('MainWindow', 'Flash'),
+                QCoreApplication.translate('MainWindow', 'CPU'),
+                QCoreApplication.translate('MainWindow', 'Serial'),
+                QCoreApplication.translate('MainWindow', 'Manufacturer'),
+            )
+        values = (
+            device.uid, device.chip_id, device.mac_address, device.firmware_version, device.hardware_version,
+            device.flash_size, device.cpu_frequency, device.serial_number, device.manufacturer,
+        )
+        lines = [f"{label}: {value or 'N/A'}" for label, value in zip(self._details_labels, values)]
+        lines.append(f"VID:PID: {device.vid_pid}")
         return "\n".join(lines)
 
     def _build_device_details_group(self) -> QGroupBox:
@@ -1322,22 +1816,7 @@ class MainWindow(QMainWindow):
         def _fmt(value):
             return value if value not in (None, "", "N/A") else "N/A"
 
-        def _fmt_hex(val):
-            try:
-                if val is None:
-                    return None
-                if isinstance(val, int):
-                    return f"0x{val:04X}"
-                s = str(val).strip()
-                if s.lower().startswith("0x"):
-                    return f"0x{int(s,16):04X}"
-                return f"0x{int(s):04X}"
-            except Exception:
-                return str(val)
-
-        vid = _fmt_hex(getattr(device, 'vid', None))
-        pid = _fmt_hex(getattr(device, 'pid', None))
-        vidpid = f"{vid}:{pid}" if vid and pid else "N/A"
+        vidpid = device.vid_pid
 
         details_map = {
             "board": device.board_type.value,
@@ -1393,9 +1872,9 @@ class MainWindow(QMainWindow):
             # Visual feedback only: blue background when checked
             try:
                 if item.checkState() == Qt.Checked:
-                    item.setBackground(QColor("#dbeafe"))  # light blue
+                    item.setBackground(MainWindow._BRUSH_CHECKED)
                 else:
-                    item.setBackground(QColor(Qt.transparent))
+                    item.setBackground(MainWindow._BRUSH_CLEAR)
             except Exception:
                 pass
 
@@ -1468,7 +1947,7 @@ class MainWindow(QMainWindow):
                 device,
                 machine_id_text
             )
-            self.uid_worker.finished.connect(lambda: self._on_uid_load_success(device, row, show_info))
+            self.uid_worker.succeeded.connect(lambda: self._on_uid_load_success(device, row, show_info))
             self.uid_worker.error.connect(lambda err: self._on_uid_load_error(err))
             self.uid_worker.start()
 
@@ -1781,13 +2260,9 @@ class MainWindow(QMainWindow):
                 return
             client_name = (self.client_name.text() if hasattr(self, 'client_name') else self.config.get('client_name', '')).strip()
 
-            smtp_config = self.config.get('smtp', {})
-            azure_config = self.config.get('azure', {})
-            
-            is_smtp_valid = smtp_config.get('host') and smtp_config.get('username')
-            is_azure_valid = azure_config.get('enabled') and azure_config.get('client_id')
-            
-            if not is_smtp_valid and not is_azure_valid:
+            # Support mail goes to a fixed address, so configured recipients are not required
+            ready, _, smtp_config, azure_config, _ = self._validate_email_ready(require_recipients=False)
+            if not ready:
                 QMessageBox.warning(dialog, QCoreApplication.translate("MainWindow", "Email Not Configured"), QCoreApplication.translate("MainWindow", "Please configure Email settings first in Settings > Configure Email."))
                 return
 
@@ -1803,20 +2278,7 @@ class MainWindow(QMainWindow):
                 if reply == QMessageBox.Yes:
                     include_logs_chk.setChecked(True)
 
-            # Prepare optional logs zip
-            attachment_path = None
-            try:
-                if include_logs_chk.isChecked():
-                    logs_dir = Config.LOGS_DIR
-                    zip_path = Config.APPDATA_DIR / "logs_bundle.zip"
-                    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                        if logs_dir.exists():
-                            for p in logs_dir.glob('*.log'):
-                                zf.write(p, arcname=p.name)
-                    attachment_path = zip_path if zip_path.exists() else None
-            except Exception as e:
-                logger.warning(f"Failed to build logs zip: {e}")
-                attachment_path = None
+            include_logs = include_logs_chk.isChecked()
 
             # Build email body
             operator_name = self.operator_name.text()
@@ -1829,7 +2291,7 @@ class MainWindow(QMainWindow):
             install_type = "Production" if getattr(sys, 'frozen', False) else "Development"
             timestamp = QDateTime.currentDateTime().toString('yyyy-MM-dd HH:mm:ss')
             
-            if include_logs_chk.isChecked():
+            if include_logs:
                 logs_status = QCoreApplication.translate("MainWindow", "Logs are attached to this email.")
             else:
                 logs_status = ""
@@ -1874,28 +2336,38 @@ Best regards,
                 val = self.progress_bar.value()
                 self.progress_bar.setValue(min(100, val + 20))
 
-            success = False
-            try:
-                success = self.email_sender.send_email(
+            def send_request():
+                # Runs on the thread pool: bundling logs and sending can take seconds
+                attachment_path = _bundle_logs(Config.LOGS_DIR, Config.APPDATA_DIR / "logs_bundle.zip") if include_logs else None
+                return self.email_sender.send_email(
                     smtp_config=smtp_config,
                     recipients=["armida@kumuluswater.com"],
                     subject=f"AWG-Kumulus Support Request - {QDateTime.currentDateTime().toString('yyyy-MM-dd HH:mm')}",
                     body=body,
                     attachment_path=attachment_path,
-                    progress_callback=update_progress,
+                    progress_callback=task.signals.progress.emit,
                     azure_config=azure_config
                 )
-            except Exception as e:
-                self.log(f"Error sending support email: {e}")
-                QMessageBox.critical(dialog, QCoreApplication.translate("MainWindow", "Error"), f"{QCoreApplication.translate('MainWindow', 'Failed to send support email:')}\n{e}")
-            finally:
+
+            def on_finished(success):
                 self.progress_bar.setVisible(False)
+                btns.setEnabled(True)
+                if success:
+                    QMessageBox.information(dialog, QCoreApplication.translate("MainWindow", "Support Request Sent"), QCoreApplication.translate("MainWindow", "Your request has been sent to support. We'll get back to you soon."))
+                    dialog.accept()
+                else:
+                    QMessageBox.warning(dialog, QCoreApplication.translate("MainWindow", "Failed"), QCoreApplication.translate("MainWindow", "Could not send support request. Please check SMTP settings and try again."))
 
-            if success:
-                QMessageBox.information(dialog, QCoreApplication.translate("MainWindow", "Support Request Sent"), QCoreApplication.translate("MainWindow", "Your request has been sent to support. We'll get back to you soon."))
-                dialog.accept()
-            else:
-                QMessageBox.warning(dialog, QCoreApplication.translate("MainWindow", "Failed"), QCoreApplication.translate("MainWindow", "Could not send support request. Please check SMTP settings and try again."))
+            def on_error(error):
+                self.progress_bar.setVisible(False)
+                btns.setEnabled(True)
+                self.log(f"Error sending support email: {error}")
+                QMessageBox.critical(dialog, QCoreApplication.translate("MainWindow", "Error"), f"{QCoreApplication.translate('MainWindow', 'Failed to send support email:')}\n{error}")
+
+            btns.setEnabled(False)
+            task = PoolTask(send_request)
+            task.signals.progress.connect(update_progress, Qt.QueuedConnection)
+            self._start_pool_task(task, on_finished=on_finished, on_error=on_error)
 
         btns.accepted.connect(on_accept)
         btns.rejected.connect(dialog.reject)
@@ -1908,39 +2380,26 @@ Best regards,
             self.flash_btn.setEnabled(False)
 
         # Reset machine ID widgets to reflect the selected type
-        machine_types = Config.get_machine_types(self.config)
-        if text in machine_types:
-            prefix = machine_types[text]['prefix']
-            length = machine_types[text]['length']
-            remaining = max(0, length - len(prefix))
+        hints = self._machine_id_hints.get(text)
+        if hints:
+            prefix = hints['prefix']
 
             # Update prefix display
             self.machine_id_prefix_display.setText(prefix)
 
             # Configure suffix editor with numeric validator of exact length
-            regex = QRegularExpression(fr"^\d{{{remaining}}}$")
-            validator = QRegularExpressionValidator(regex)
+            validator = self._suffix_validator(prefix, hints['length'], hints['regex'])
             # Ensure the line edit exists for the editable combo box
             if self.machine_id_suffix.lineEdit():
                 self.machine_id_suffix.lineEdit().setValidator(validator)
-                self.machine_id_suffix.lineEdit().setPlaceholderText("0" * remaining)
+                self.machine_id_suffix.lineEdit().setPlaceholderText(hints['suffix_placeholder'])
 
             # Seed a few example suffixes for quick selection
-            examples = [
-                "0" * remaining,
-                "1" * remaining,
-                ("1234567890"[:remaining] if remaining > 0 else ""),
-                "9" * remaining,
-            ]
             self.machine_id_suffix.clear()
-            # Filter empty or duplicates
-            for ex in [e for e in examples if e]:
-                if ex not in [self.machine_id_suffix.itemText(i) for i in range(self.machine_id_suffix.count())]:
-                    self.machine_id_suffix.addItem(ex)
+            self.machine_id_suffix.addItems(hints['examples'])
 
             # Update full ID placeholder and composed text
-            placeholder = prefix + ("X" * remaining)
-            self.machine_id.setPlaceholderText(f"e.g., {placeholder}")
+            self.machine_id.setPlaceholderText(hints['placeholder'])
             current_suffix = self.machine_id_suffix.currentText().strip()
             if current_suffix:
                 self.machine_id.setText(prefix + current_suffix)
@@ -1959,7 +2418,7 @@ Best regards,
         try:
             self.config['machine_id_suffix'] = suffix
             self.config['machine_id'] = self.machine_id.text()
-            Config.save_config(self.config)
+            self._save_config_now()
         except Exception:
             pass
             
@@ -1967,7 +2426,7 @@ Best regards,
         """Save client name to config."""
         try:
             self.config['client_name'] = text.strip()
-            Config.save_config(self.config)
+            self._save_config_now()
         except Exception:
             pass
     
@@ -1987,7 +2446,7 @@ Best regards,
             
             # Validate machine ID format
             machine_type = self.machine_type.currentText()
-            machine_types = Config.get_machine_types(self.config)
+            machine_types = self._machine_types_cache
             type_config = machine_types[machine_type]
             
             is_valid, error_message = Config.validate_machine_id(machine_id, type_config)
@@ -2013,24 +2472,20 @@ Best regards,
                 self.devices, operator_info, machine_type, machine_id
             )
             
-            self.last_report_path = report_path  # Store for email sending
+            self._set_last_report(report_path)  # Store for email sending
             self.progress_bar.setValue(100)
             
-            # Save to OneDrive if enabled
+            # Save to OneDrive if enabled; runs on the pool alongside the confirmation/email
             if self.onedrive_manager.is_enabled():
                 self.log(QCoreApplication.translate("MainWindow", "Syncing data to OneDrive..."))
-                success = self.onedrive_manager.save_machine_data(
+                self._start_onedrive_sync(
                     operator_name=operator_name,
                     operator_email=operator_email,
                     client_name=client_name,
                     machine_type=machine_type,
                     machine_id=machine_id,
-                    devices=self.devices
+                    report=True
                 )
-                if success:
-                    self.log(QCoreApplication.translate("MainWindow", "[SUCCESS] Data synced to OneDrive successfully"))
-                else:
-                    self.log(QCoreApplication.translate("MainWindow", "[WARNING] OneDrive sync failed - check logs"))
             
             # Ask user to confirm data and send email
             reply = QMessageBox.question(
@@ -2065,7 +2520,118 @@ Best regards,
             self.log(f"Error generating report: {e}")
             QMessageBox.critical(self, QCoreApplication.translate("MainWindow", "Error"), f"{QCoreApplication.translate('MainWindow', 'Failed to generate report:')} {e}")
         finally:
-            self.progress_bar.setVisible(False)
+            # The email worker owns the progress bar while it is sending
+            if not self._email_sending():
+                self.progress_bar.setVisible(False)
+
+    def _start_onedrive_sync(self, report: bool, **machine_info):
+        """Save machine data to OneDrive on the global thread pool."""
+        task = PoolTask(
+            self.onedrive_manager.save_machine_data,
+            devices=list(self.devices),
+            **machine_info
+        )
+
+        def _done(success):
+            if not report:
+                return
+            if success:
+                self.log(QCoreApplication.translate("MainWindow", "[SUCCESS] Data synced to OneDrive successfully"))
+            else:
+                self.log(QCoreApplication.translate("MainWindow", "[WARNING] OneDrive sync failed - check logs"))
+
+        def _failed(error):
+            logger.warning(f"OneDrive sync error: {error}")
+            if report:
+                self.log(QCoreApplication.translate("MainWindow", "[WARNING] OneDrive sync failed - check logs"))
+
+        self._start_pool_task(task, _done, _failed)
+
+    def _schedule_config_save(self):
+        """Write the config once CONFIG_SAVE_DEBOUNCE_MS passes without another save request."""
+        self._config_save_timer.start()
+
+    def _flush_config(self):
+        """Write the config now unless it is unchanged since the last write."""
+        self._config_save_timer.stop()
+        blob = json.dumps(self.config, sort_keys=True, default=str)
+        if blob == self._last_saved_config:
+            return
+        self._last_saved_config = blob
+        self._save_config_async()
+
+    def _save_config_async(self):
+        """Write a snapshot of the config on the global thread pool; warn only if it fails."""
+        def _failed(error):
+            self._last_saved_config = None
+            logger.error(f"Failed to save configuration: {error}")
+            QMessageBox.warning(self, QCoreApplication.translate("MainWindow", "Error"),
+                                QCoreApplication.translate("MainWindow", "Failed to save configuration: {}").format(error))
+
+        self._config_save_generation += 1
+        self._start_pool_task(
+            PoolTask(self._write_config_snapshot, copy.deepcopy(self.config), self._config_save_generation),
+            on_error=_failed,
+        )
+
+    def _save_config_now(self, config=None):
+        """Write the config on the calling thread, superseding any write still queued on the pool."""
+        self._config_save_timer.stop()
+        self._last_saved_config = None
+        self._config_save_generation += 1
+        self._write_config_snapshot(self.config if config is None else config, self._config_save_generation)
+
+    def _write_config_snapshot(self, config, generation):
+        """Write one config snapshot unless a newer one has been handed to a writer since."""
+        with self._config_write_lock:
+            if generation != self._config_save_generation:
+                return
+            Config.save_config(config)
+            self._config_written_generation = generation
+
+    def _save_credentials_async(self, username: str, password: str):
+        """Store the SMTP password in the OS keyring on the global thread pool."""
+        def _done(saved):
+            if not saved:
+                self._show_status(QCoreApplication.translate("MainWindow", "Failed to save the email password to the system keyring"))
+
+        self._start_pool_task(
+            PoolTask(self.email_sender.save_credentials, username, password),
+            on_finished=_done,
+            on_error=lambda error: _done(False)
+        )
+
+    def _start_pool_task(self, task, on_finished=None, on_error=None):
+        """Start a PoolTask on the global pool, keeping it and its signals alive until it reports back."""
+        self._pool_tasks.add(task)
+
+        def _finished(result):
+            self._pool_tasks.discard(task)
+            if on_finished:
+                on_finished(result)
+
+        def _error(error):
+            self._pool_tasks.discard(task)
+            if on_error:
+                on_error(error)
+
+        task.signals.finished.connect(_finished)
+        task.signals.error.connect(_error)
+        QThreadPool.globalInstance().start(task)
+
+    def _set_last_report(self, report_path):
+        """Remember a freshly written report and watch it for removal."""
+        old = self._report_watcher.files()
+        if old:
+            self._report_watcher.removePaths(old)
+        self.last_report_path = Path(report_path) if report_path else None
+        self._last_report_exists = self.last_report_path is not None
+        if self.last_report_path is not None:
+            self._report_watcher.addPath(str(self.last_report_path))
+
+    def _on_report_file_changed(self, path: str):
+        if self.last_report_path is not None and path == str(self.last_report_path):
+            self._last_report_exists = self.last_report_path.exists()
 
     def auto_generate_report_if_ready(self):
         """Silently generate an Excel report after refresh when inputs are valid.
@@ -2080,7 +2646,7 @@ Best regards,
                 return  # Not ready; do nothing
 
             machine_type = self.machine_type.currentText()
-            machine_types = Config.get_machine_types(self.config)
+            machine_types = self._machine_types_cache
             type_config = machine_types.get(machine_type)
             if not type_config:
                 return
@@ -2093,17 +2659,17 @@ Best regards,
             report_path = self.report_generator.generate_report(
                 self.devices, operator_info, machine_type, machine_id
             )
-            self.last_report_path = report_path
+            self._set_last_report(report_path)
 
             # Save to OneDrive if enabled
             if self.onedrive_manager.is_enabled():
-                self.onedrive_manager.save_machine_data(
+                self._start_onedrive_sync(
                     operator_name=operator_name,
                     operator_email=operator_email,
                     client_name=client_name,
                     machine_type=machine_type,
                     machine_id=machine_id,
-                    devices=self.devices
+                    report=False
                 )
             # Minimal feedback in status bar
             self._show_status(QCoreApplication.translate("MainWindow", "Report generated automatically"))
@@ -2115,14 +2681,22 @@ Best regards,
         # User requested that clicking "Send Email" triggers report generation and confirmation
         self.generate_report()
     
+    def _pending_queued_emails(self):
+        """Return queued emails without creating the email service just to look."""
+        if 'email_sender' in self.__dict__:
+            return self.email_sender.queue_manager.get_pending_emails()
+        from ..core.email_queue import EmailQueueManager
+        return EmailQueueManager().get_pending_emails()
+
     def process_email_queue(self):
         """Process queued emails when internet is available."""
-        # Check internet without blocking UI too much
-        # (check_internet_connection uses a short timeout)
-        if not check_internet_connection():
-            return
-            
         try:
+            if not self._pending_queued_emails():
+                return
+            # Check internet without blocking UI too much
+            # (check_internet_connection uses a short timeout)
+            if not check_internet_connection():
+                return
             pending = self.email_sender.queue_manager.get_pending_emails()
             if not pending:
                 return
@@ -2167,57 +2741,66 @@ Best regards,
         except Exception as e:
             logger.error(f"Error in process_email_queue: {e}")
 
+    def _validate_email_ready(self, require_recipients: bool = True):
+        """Check saved email settings in one pass.
+
+        Returns (ok, error_message, smtp_config, azure_config, recipients).
+        """
+        smtp = self.config.get('smtp') or {}
+        azure = self.config.get('azure') or {}
+        recipients = self.config.get('recipients') or []
+        if azure.get('enabled', False) and not azure.get('client_id'):
+            # Incomplete Azure settings fall back to SMTP instead of blocking a working SMTP setup
+            azure = dict(azure, enabled=False)
+        if not azure.get('enabled', False):
+            if not smtp.get('host'):
+                return False, QCoreApplication.translate("MainWindow", "Email is not configured."), smtp, azure, recipients
+            if not smtp.get('username'):
+                return False, QCoreApplication.translate("MainWindow", "SMTP username not configured."), smtp, azure, recipients
+        if require_recipients and not recipients:
+            return False, QCoreApplication.translate("MainWindow", "Please add email recipients in settings."), smtp, azure, recipients
+        return True, None, smtp, azure, recipients
+
+    def _email_sending(self) -> bool:
+        return self._email_worker is not None
+
     def send_email_automatically(self):
         """Automatically send email with the last generated report."""
+        if self._email_sending():
+            self._show_status(QCoreApplication.translate("MainWindow", "An email is already being sent..."))
+            return
+
         if not check_internet_connection():
              QMessageBox.warning(self, QCoreApplication.translate("MainWindow", "Internet Required"), QCoreApplication.translate("MainWindow", "Please connect to the internet to send support emails."))
              return
 
-        if not self.last_report_path or not self.last_report_path.exists():
+        if not self.last_report_path or not self._last_report_exists:
             QMessageBox.warning(self, QCoreApplication.translate("MainWindow", "No Report"), 
                               QCoreApplication.translate("MainWindow", "No report available to send."))
             return
         
-        smtp_config = self.config.get('smtp', {})
-        azure_config = self.config.get('azure', {})
-        recipients = self.config.get('recipients', [])
+        ready, error, smtp_config, azure_config, recipients = self._validate_email_ready()
         
         logger.info(f"Email Config Check: Azure Enabled={azure_config.get('enabled')}, SMTP Host={smtp_config.get('host')}")
         
-        # Check configuration
-        is_azure = azure_config.get('enabled', False)
-        if not is_azure and not smtp_config.get('host'):
+        if not ready:
+            # Every missing setting (server, username, recipients) lives in the email dialog
             reply = QMessageBox.question(
                 self,
                 QCoreApplication.translate("MainWindow", "Email Not Configured"),
-                QCoreApplication.translate("MainWindow", "Email is not configured. Would you like to configure it now?"),
+                error + "\n\n" + QCoreApplication.translate("MainWindow", "Would you like to configure it now?"),
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.Yes:
                 self.configure_email_dialog()
             return
         
-        if not recipients:
-            QMessageBox.warning(self, QCoreApplication.translate("MainWindow", "No Recipients"),
-                              QCoreApplication.translate("MainWindow", "Please add email recipients in settings."))
-            return
-        
-        if not is_azure and not smtp_config.get('username'):
-            QMessageBox.warning(self, QCoreApplication.translate("MainWindow", "Email Not Configured"),
-                              QCoreApplication.translate("MainWindow", "SMTP username not configured."))
-            return
-        
         try:
             # Show progress
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(0)
             
-            # Update progress in log
-            def update_progress(msg):
-                self.log(msg)
-                self.progress_bar.setValue(self.progress_bar.value() + 25)
-            
-            update_progress(QCoreApplication.translate("MainWindow", "Connecting to email server..."))
+            self._on_email_progress(QCoreApplication.translate("MainWindow", "Connecting to email server..."))
             
             # Get operator info for email body
             operator_name = self.operator_name.text()
@@ -2257,79 +2840,99 @@ Please find the attached Excel report with complete device information including
                 device_summary=device_summary
             )
             
-            update_progress(QCoreApplication.translate("MainWindow", "Sending email..."))
+            self._on_email_progress(QCoreApplication.translate("MainWindow", "Sending email..."))
             
-            # Send email
-            success = self.email_sender.send_email(
+            # Send email in the background; SMTP/Graph round-trips must not block the UI
+            send_kwargs = dict(
                 smtp_config=smtp_config,
                 recipients=recipients,
                 subject=QCoreApplication.translate("MainWindow", "AWG Kumulus Report - {} - {} - {}").format(client_name or 'Client', machine_type, machine_id),
                 body=email_body,
                 attachment_path=self.last_report_path,
-                progress_callback=update_progress,
+                progress_callback=self.email_progress.emit,
                 azure_config=azure_config,
                 sender_override=operator_email if operator_email else None
             )
-            
-            self.progress_bar.setValue(100)
-            
-            if success:
-                update_progress(QCoreApplication.translate("MainWindow", "Email sent successfully!"))
-                QMessageBox.information(self, QCoreApplication.translate("MainWindow", "Email Sent"),
-                                      QCoreApplication.translate("MainWindow", "Report sent successfully to:\n") +
-                                      "\n".join(recipients))
-            else:
-                QMessageBox.warning(self, QCoreApplication.translate("MainWindow", "Email Failed"),
-                                  QCoreApplication.translate("MainWindow", "Failed to send email. Check logs for details."))
+
+            # Resolve the lazily created sender here, not on the worker thread
+            email_sender = self.email_sender
+
+            def _send():
+                if not email_sender.send_email(**send_kwargs):
+                    raise RuntimeError(QCoreApplication.translate("MainWindow", "Failed to send email. Check logs for details."))
+
+            self._email_recipients = list(recipients)
+            def _done(_result):
+                self._email_worker = None
+                self._on_email_done()
+
+            def _failed(error):
+                self._email_worker = None
+                self._on_email_error(error)
+
+            self._email_worker = PoolTask(_send)
+            self._start_pool_task(self._email_worker, on_finished=_done, on_error=_failed)
             
         except Exception as e:
             self.log(f"Error sending email: {e}")
             QMessageBox.critical(self, QCoreApplication.translate("MainWindow", "Error"), 
                                f"{QCoreApplication.translate('MainWindow', 'Failed to send email:')}\n{str(e)}")
-        finally:
             self.progress_bar.setVisible(False)
+
+    def _on_email_progress(self, msg: str):
+        """Log an email progress step and advance the progress bar."""
+        self.log(msg)
+        self.progress_bar.setValue(min(self.progress_bar.value() + 25, 95))
+
+    def _on_email_done(self):
+        """Handle successful background email send."""
+        self.progress_bar.setValue(100)
+        self.progress_bar.setVisible(False)
+        self.log(QCoreApplication.translate("MainWindow", "Email sent successfully!"))
+        QMessageBox.information(self, QCoreApplication.translate("MainWindow", "Email Sent"),
+                              QCoreApplication.translate("MainWindow", "Report sent successfully to:\n") +
+                              "\n".join(getattr(self, '_email_recipients', [])))
+
+    def _on_email_error(self, error: str):
+        """Handle a failed background email send."""
+        self.progress_bar.setVisible(False)
+        self.log(f"Error sending email: {error}")
+        QMessageBox.warning(self, QCoreApplication.translate("MainWindow", "Email Failed"), error)
     
     def _create_device_summary(self) -> str:
         """Create a detailed summary of detected devices for email."""
         if not self.devices:
             return "No devices detected."
         
-        summary_lines = []
-        for i, device in enumerate(self.devices, 1):
-            def _fmt_hex(val):
-                try:
-                    if val is None:
-                        return None
-                    if isinstance(val, int):
-                        return f"0x{val:04X}"
-                    s = str(val).strip()
-                    if s.lower().startswith("0x"):
-                        return f"0x{int(s,16):04X}"
-                    return f"0x{int(s):04X}"
-                except Exception:
-                    return str(val)
-            device_info = [
-                f"Device {i}:",
-                f"  Board Type: {device.board_type.value}",
-                f"  Port: {device.port}",
-                f"  UID: {device.uid or 'N/A'}",
-                f"  Chip ID: {device.chip_id or 'N/A'}",
-                f"  MAC Address: {device.mac_address or 'N/A'}",
-                f"  Manufacturer: {device.manufacturer or 'N/A'}",
-                f"  Serial Number: {device.serial_number or 'N/A'}",
-                f"  Firmware Version: {device.firmware_version or 'N/A'}",
-                f"  Hardware Version: {device.hardware_version or 'N/A'}",
-                f"  Flash Size: {device.flash_size or 'N/A'}",
-                f"  CPU Frequency: {device.cpu_frequency or 'N/A'}",
-                f"  VID:PID: {_fmt_hex(device.vid)}:{_fmt_hex(device.pid)}" if device.vid and device.pid else "  VID:PID: N/A",
-                ""
-            ]
-            summary_lines.extend(device_info)
-        
-        return "\n".join(summary_lines)
+        return "\n".join(
+            _SUMMARY_TMPL.format(
+                i=i,
+                bt=d.board_type.value,
+                port=d.port,
+                uid=d.uid or 'N/A',
+                cid=d.chip_id or 'N/A',
+                mac=d.mac_address or 'N/A',
+                mfr=d.manufacturer or 'N/A',
+                sn=d.serial_number or 'N/A',
+                fw=d.firmware_version or 'N/A',
+                hw=d.hardware_version or 'N/A',
+                flash=d.flash_size or 'N/A',
+                cpu=d.cpu_frequency or 'N/A',
+                vidpid=d.vid_pid,
+            )
+            for i, d in enumerate(self.devices, 1)
+        )
     
     def configure_email_dialog(self):
         """Open email configuration dialog with preset configurations and auto-detection."""
+        # Built once; later opens only reload the fields from config
+        if self._email_dialog is None:
+            self._email_dialog = self._build_email_dialog()
+        self._populate_email_dialog()
+        self._email_dialog.exec()
+
+    def _build_email_dialog(self) -> QDialog:
+        """Construct the email configuration dialog and wire its signals."""
         dialog = QDialog(self)
         dialog.setWindowTitle(QCoreApplication.translate("MainWindow", "Email Configuration"))
         dialog.setWindowState(Qt.WindowMaximized)
@@ -2355,25 +2958,9 @@ Please find the attached Excel report with complete device information including
         provider_combo.addItems(["Auto-detect from email", "Gmail", "Outlook/Hotmail", "Office 365", "Custom", "Azure (Graph API)"])
         provider_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "Provider:")), provider_combo)
         
-        # Select current provider
-        if self.config.get('azure', {}).get('enabled'):
-            provider_combo.setCurrentText('Azure (Graph API)')
-        elif self.config.get('smtp', {}).get('host'):
-             # Try to match SMTP host to provider
-             host = self.config.get('smtp', {}).get('host')
-             if 'gmail.com' in host:
-                 provider_combo.setCurrentText('Gmail')
-             elif 'outlook.com' in host or 'hotmail.com' in host:
-                 provider_combo.setCurrentText('Outlook/Hotmail')
-             elif 'office365.com' in host:
-                 provider_combo.setCurrentText('Office 365')
-             else:
-                 provider_combo.setCurrentText('Custom')
-        
         # Email Username (for auto-detection)
         smtp_user = QLineEdit()
-        smtp_user.setText(self.config.get('smtp', {}).get('username', ''))
-        smtp_user.setPlaceholderText("your.email@gmail.com")
+        smtp_user.setPlaceholderText(self._PH_EMAIL)
         provider_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "Email Address:")), smtp_user)
         
         # Azure Configuration Group (initially hidden unless Azure is selected)
@@ -2381,20 +2968,16 @@ Please find the attached Excel report with complete device information including
         azure_layout = QFormLayout()
         
         azure_client_id = QLineEdit()
-        azure_client_id.setText(self.config.get('azure', {}).get('client_id', ''))
         azure_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "Client ID:")), azure_client_id)
         
         azure_tenant_id = QLineEdit()
-        azure_tenant_id.setText(self.config.get('azure', {}).get('tenant_id', ''))
         azure_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "Tenant ID:")), azure_tenant_id)
         
         azure_client_secret = QLineEdit()
-        azure_client_secret.setText(self.config.get('azure', {}).get('client_secret', ''))
         azure_client_secret.setEchoMode(QLineEdit.Password)
         azure_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "Client Secret:")), azure_client_secret)
         
         azure_sender_email = QLineEdit()
-        azure_sender_email.setText(self.config.get('azure', {}).get('sender_email', ''))
         azure_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "Sender Email:")), azure_sender_email)
         
         azure_group.setLayout(azure_layout)
@@ -2415,18 +2998,15 @@ Please find the attached Excel report with complete device information including
         
         # SMTP Server
         smtp_host = QLineEdit()
-        smtp_host.setText(self.config.get('smtp', {}).get('host', ''))
-        smtp_host.setPlaceholderText("e.g., smtp.gmail.com")
+        smtp_host.setPlaceholderText(self._PH_SMTP_HOST)
         smtp_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "SMTP Server:")), smtp_host)
         
         # Port
         smtp_port = QLineEdit()
-        smtp_port.setText(str(self.config.get('smtp', {}).get('port', 587)))
         smtp_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "Port:")), smtp_port)
         
         # TLS checkbox
         tls_checkbox = QCheckBox(QCoreApplication.translate("MainWindow", "Use TLS/STARTTLS"))
-        tls_checkbox.setChecked(self.config.get('smtp', {}).get('tls', True))
         smtp_layout.addRow(QLabel(QCoreApplication.translate("MainWindow", "Security:")), tls_checkbox)
         
         # Password
@@ -2443,7 +3023,6 @@ Please find the attached Excel report with complete device information including
         recipients_text = QTextEdit()
         recipients_text.setMaximumHeight(100)
         recipients_text.setPlaceholderText(QCoreApplication.translate("MainWindow", "Enter email addresses, one per line"))
-        recipients_text.setPlainText("\n".join(self.config.get('recipients', [])))
         recipients_layout.addWidget(recipients_text)
         recipients_group.setLayout(recipients_layout)
         layout.addWidget(recipients_group)
@@ -2455,7 +3034,7 @@ Please find the attached Excel report with complete device information including
         # Dynamic guide label that changes based on provider selection
         self.dynamic_guide = QLabel(QCoreApplication.translate("MainWindow", "Select an email provider to see specific configuration instructions"))
         self.dynamic_guide.setOpenExternalLinks(True)
-        self.dynamic_guide.setStyleSheet("color: #333; font-size: 10px; background: #f0f8ff; padding: 8px; border-radius: 4px; border: 1px solid #b0d4f1;")
+        self.dynamic_guide.setObjectName("GuideInfo")
         guide_layout.addWidget(self.dynamic_guide)
         
         guide_group.setLayout(guide_layout)
@@ -2491,8 +3070,7 @@ Please find the attached Excel report with complete device information including
                     'sender_email': azure_sender_email.text().strip()
                 }
                 
-                recips_str = recipients_text.toPlainText().strip()
-                recips = [r.strip() for r in recips_str.split('\n') if r.strip()]
+                recips = _parse_recipients(recipients_text.toPlainText())
                 
                 if not recips:
                      QMessageBox.warning(dialog, QCoreApplication.translate("MainWindow", "Missing Info"), QCoreApplication.translate("MainWindow", "Please add at least one recipient."))
@@ -2545,8 +3123,7 @@ Please find the attached Excel report with complete device information including
             port_str = smtp_port.text().strip()
             user = smtp_user.text().strip()
             pwd = smtp_pass.text()
-            recips_str = recipients_text.toPlainText().strip()
-            recips = [r.strip() for r in recips_str.split('\n') if r.strip()]
+            recips = _parse_recipients(recipients_text.toPlainText())
 
             if not host or not port_str or not user:
                 QMessageBox.warning(dialog, QCoreApplication.translate("MainWindow", "Missing Info"), QCoreApplication.translate("MainWindow", "Please fill in Host, Port, and Email Address."))
@@ -2691,93 +3268,30 @@ Please find the attached Excel report with complete device information including
                     else:
                         provider = 'Custom'
             
-            # Update guide based on provider
-            if provider == 'Azure (Graph API)':
-                guide_text = """
-                <b>[EMAIL] Azure (Graph API) Configuration:</b><br>
-                1. Uses Microsoft Graph API for sending emails.<br>
-                2. Requires App Registration in Azure Portal.<br>
-                3. Configuration is loaded from config file (client_id, client_secret, etc.).<br>
-                <b>Note:</b> SMTP settings below are ignored when Azure is selected.<br>
-                """
-                self.dynamic_guide.setStyleSheet("color: #333; font-size: 10px; background: #e6f7ff; padding: 8px; border-radius: 4px; border: 1px solid #1890ff;")
-
-            elif provider == 'Gmail':
-                guide_text = """
-                <b>[EMAIL] Gmail Configuration:</b><br>
-                1. Enable 2-Step Verification: <a href="https://myaccount.google.com/security">https://myaccount.google.com/security</a><br>
-                2. Generate App Password: <a href="https://myaccount.google.com/apppasswords">https://myaccount.google.com/apppasswords</a><br>
-                3. Use App Password (16 characters) instead of your regular password<br>
-                <b>Settings:</b> smtp.gmail.com, Port 587, TLS enabled<br><br>
-                <b>[COMMON] Common Gmail Issues:</b><br>
-                • <b>Error 535:</b> Wrong username/password - Use App Password<br>
-                • <b>Error 534:</b> App Password required - Enable 2FA first<br>
-                • <b>Still having issues?</b> <a href="https://support.google.com/mail/answer/7126229">Gmail Help</a>
-                """
-                self.dynamic_guide.setStyleSheet("color: #333; font-size: 10px; background: #f0f8ff; padding: 8px; border-radius: 4px; border: 1px solid #b0d4f1;")
-                
-            elif provider == 'Outlook/Hotmail':
-                guide_text = """
-                <b>[EMAIL] Outlook/Hotmail Configuration:</b><br>
-                1. Enable 2-Step Verification: <a href="https://account.microsoft.com/security">https://account.microsoft.com/security</a><br>
-                2. Generate App Password: <a href="https://account.microsoft.com/security/app-passwords">https://account.microsoft.com/security/app-passwords</a><br>
-                3. Use App Password instead of your regular password<br>
-                <b>Settings:</b> smtp-mail.outlook.com, Port 587, TLS enabled<br><br>
-                <b>[COMMON] Common Outlook Issues:</b><br>
-                • <b>Error 535:</b> Wrong username/password - Use App Password<br>
-                • <b>Error 534:</b> App Password required - Enable 2FA first<br>
-                • <b>Still having issues?</b> <a href="https://support.microsoft.com/en-us/office/pop-imap-and-smtp-settings-for-outlook-8361e398-8af4-4e97-b147-6c6c4ac95353">Outlook Help</a>
-                """
-                self.dynamic_guide.setStyleSheet("color: #333; font-size: 10px; background: #fff0f0; padding: 8px; border-radius: 4px; border: 1px solid #f1b0b0;")
-                
-            elif provider == 'Office 365':
-                guide_text = """
-                <b>[EMAIL] Office 365 Configuration:</b><br>
-                1. Contact your IT administrator for SMTP settings<br>
-                2. May require App Password: <a href="https://account.microsoft.com/security/app-passwords">https://account.microsoft.com/security/app-passwords</a><br>
-                3. Some organizations disable SMTP authentication<br>
-                <b>Settings:</b> smtp.office365.com, Port 587, TLS enabled<br><br>
-                <b>[COMMON] Common Office 365 Issues:</b><br>
-                • <b>Error 535:</b> Wrong username/password - Use App Password<br>
-                • <b>Error 550:</b> Authentication failed - Check with IT admin<br>
-                • <b>Still having issues?</b> Contact your IT administrator
-                """
-                self.dynamic_guide.setStyleSheet("color: #333; font-size: 10px; background: #f0fff0; padding: 8px; border-radius: 4px; border: 1px solid #b0f1b0;")
-                
-            elif provider == 'Custom':
-                guide_text = """
-                <b>[EMAIL] Custom Email Configuration:</b><br>
-                1. Contact your email provider for SMTP settings<br>
-                2. Common settings: smtp.yourdomain.com, Port 587 or 465<br>
-                3. Check if TLS/SSL is required<br>
-                4. Verify username and password requirements<br><br>
-                <b>[COMMON] Common Custom Issues:</b><br>
-                • <b>Error 535:</b> Wrong username/password - Check credentials<br>
-                • <b>Error 550:</b> Authentication failed - Check SMTP settings<br>
-                • <b>Connection timeout:</b> Check firewall/antivirus settings<br>
-                • <b>Still having issues?</b> Contact your email provider
-                """
-                self.dynamic_guide.setStyleSheet("color: #333; font-size: 10px; background: #fff8f0; padding: 8px; border-radius: 4px; border: 1px solid #f1d0b0;")
-                
-            else:
-                guide_text = """
-                <b>[EMAIL] Email Configuration:</b><br>
-                Select an email provider from the dropdown above to see specific configuration instructions.<br><br>
-                <b>Supported Providers:</b><br>
-                • <b>Gmail:</b> Personal Google accounts<br>
-                • <b>Outlook/Hotmail:</b> Personal Microsoft accounts<br>
-                • <b>Office 365:</b> Business Microsoft accounts<br>
-                • <b>Custom:</b> Other email providers
-                """
-                self.dynamic_guide.setStyleSheet("color: #333; font-size: 10px; background: #f0f8ff; padding: 8px; border-radius: 4px; border: 1px solid #b0d4f1;")
-            
-            self.dynamic_guide.setText(guide_text)
+            html = _SMTP_GUIDE_HTML.get(provider, _SMTP_GUIDE_HTML['__default__'])
+            style = _SMTP_GUIDE_STYLE.get(provider, _SMTP_GUIDE_STYLE['__default__'])
+            # The colours come from the app stylesheet by object name; repolish only on change
+            if self.dynamic_guide.objectName() != style:
+                self.dynamic_guide.setObjectName(style)
+                self.dynamic_guide.style().unpolish(self.dynamic_guide)
+                self.dynamic_guide.style().polish(self.dynamic_guide)
+            if self.dynamic_guide.text() != html:
+                self.dynamic_guide.setText(html)
         
         # Connect signals
         auto_detect_btn.clicked.connect(auto_detect_settings)
-        provider_combo.currentTextChanged.connect(apply_preset_config)
-        provider_combo.currentTextChanged.connect(update_dynamic_guide)
-        smtp_user.textChanged.connect(update_dynamic_guide)
+        def on_provider_changed():
+            # Preset first, then the guide; any debounced guide refresh is now redundant
+            apply_preset_config()
+            guide_timer.stop()
+            update_dynamic_guide()
+        provider_combo.currentTextChanged.connect(on_provider_changed)
+        # Debounce typing so the rich-text guide is re-laid out once per burst
+        guide_timer = QTimer(dialog)
+        guide_timer.setSingleShot(True)
+        guide_timer.setInterval(self.GUIDE_DEBOUNCE_MS)
+        guide_timer.timeout.connect(update_dynamic_guide)
+        smtp_user.textChanged.connect(lambda _: guide_timer.start())
         
         # Initial guide update
         update_dynamic_guide()
@@ -2788,8 +3302,7 @@ Please find the attached Excel report with complete device information including
             provider = provider_combo.currentText()
             logger.info(f"Saving configuration for provider: '{provider}'")
             
-            recips_str = recipients_text.toPlainText().strip()
-            recips = [r.strip() for r in recips_str.split('\n') if r.strip()]
+            recips = _parse_recipients(recipients_text.toPlainText())
             
             # Common config
             self.config['recipients'] = recips
@@ -2827,17 +3340,67 @@ Please find the attached Excel report with complete device information including
                 # Save password securely if provided
                 pwd = smtp_pass.text()
                 if pwd:
-                    self.email_sender.save_credentials(smtp_user.text(), pwd)
+                    self._save_credentials_async(smtp_user.text(), pwd)
             
-            Config.save_config(self.config)
+            # Same debounce, dedupe and write order as the other settings saves, flushed now
+            self._flush_config()
             QMessageBox.information(self, "Configuration Saved", "Email configuration saved successfully!")
             dialog.accept()
             
         # Override the dialog buttons to use our custom save logic
         buttons.accepted.disconnect() # Disconnect default accept
         buttons.accepted.connect(save_configuration)
-        
-        dialog.exec()
+
+        self._email_widgets = {
+            'provider_combo': provider_combo,
+            'smtp_user': smtp_user,
+            'azure_client_id': azure_client_id,
+            'azure_tenant_id': azure_tenant_id,
+            'azure_client_secret': azure_client_secret,
+            'azure_sender_email': azure_sender_email,
+            'smtp_host': smtp_host,
+            'smtp_port': smtp_port,
+            'tls_checkbox': tls_checkbox,
+            'smtp_pass': smtp_pass,
+            'recipients_text': recipients_text,
+        }
+        return dialog
+
+    def _populate_email_dialog(self):
+        """Load the current email settings from config into the dialog fields."""
+        w = self._email_widgets
+        smtp_cfg = self.config.get('smtp', {})
+        azure_cfg = self.config.get('azure', {})
+
+        # Select current provider first: its preset handler rewrites the SMTP
+        # fields, which are then overwritten with the saved values below
+        provider_combo = w['provider_combo']
+        if azure_cfg.get('enabled'):
+            provider_combo.setCurrentText('Azure (Graph API)')
+        elif smtp_cfg.get('host'):
+            # Try to match SMTP host to provider
+            host = smtp_cfg.get('host')
+            if 'gmail.com' in host:
+                provider_combo.setCurrentText('Gmail')
+            elif 'outlook.com' in host or 'hotmail.com' in host:
+                provider_combo.setCurrentText('Outlook/Hotmail')
+            elif 'office365.com' in host:
+                provider_combo.setCurrentText('Office 365')
+            else:
+                provider_combo.setCurrentText('Custom')
+        else:
+            provider_combo.setCurrentIndex(0)
+
+        w['smtp_user'].setText(smtp_cfg.get('username', ''))
+        w['azure_client_id'].setText(azure_cfg.get('client_id', ''))
+        w['azure_tenant_id'].setText(azure_cfg.get('tenant_id', ''))
+        w['azure_client_secret'].setText(azure_cfg.get('client_secret', ''))
+        w['azure_sender_email'].setText(azure_cfg.get('sender_email', ''))
+        w['smtp_host'].setText(smtp_cfg.get('host', ''))
+        w['smtp_port'].setText(str(smtp_cfg.get('port', 587)))
+        w['tls_checkbox'].setChecked(smtp_cfg.get('tls', True))
+        w['smtp_pass'].clear()
+        w['recipients_text'].setPlainText("\n".join(self.config.get('recipients', [])))
     
     def flash_firmware_dialog(self):
         """Open firmware flashing dialog."""
@@ -2869,15 +3432,19 @@ Please find the attached Excel report with complete device information including
         device_list = QListWidget()
         device_list.setObjectName("flash_device_list")
         device_list.setMaximumHeight(70)  # Limit height to make it smaller
+        device_list.setUniformItemSizes(True)  # Single-line rows; skip per-item size hints
         
         if self.devices:
-            for device in self.devices:
-                item_text = f"{device.board_type.value} - {device.port}"
-                if device.manufacturer:
-                    item_text += f" ({device.manufacturer})"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.UserRole, device)
-                device_list.addItem(item)
+            device_list.setUpdatesEnabled(False)
+            device_list.blockSignals(True)
+            try:
+                for device in self.devices:
+                    item = QListWidgetItem(device.display_label)
+                    item.setData(Qt.UserRole, device)
+                    device_list.addItem(item)
+            finally:
+                device_list.blockSignals(False)
+                device_list.setUpdatesEnabled(True)
             device_list.setCurrentRow(0)  # Select first device
         else:
             # Add a placeholder item if no devices
@@ -2898,10 +3465,11 @@ Please find the attached Excel report with complete device information including
         source_layout.addWidget(QLabel(QCoreApplication.translate("MainWindow", "Source Type:")))
         source_combo = QComboBox()
         source_combo.setObjectName("flash_source_combo")
+        gitlab_label = QCoreApplication.translate("MainWindow", "GitLab Repository")
         source_combo.addItems([
             QCoreApplication.translate("MainWindow", "Local File (.bin/.elf)"),
             QCoreApplication.translate("MainWindow", "URL Download"),
-            QCoreApplication.translate("MainWindow", "GitLab Repository")
+            gitlab_label
         ])
         source_layout.addWidget(source_combo)
         firmware_layout.addLayout(source_layout)
@@ -2918,6 +3486,13 @@ Please find the attached Excel report with complete device information including
         browse_btn.clicked.connect(lambda: self._browse_firmware_file(file_path))
         file_layout.addWidget(browse_btn)
         firmware_layout.addLayout(file_layout)
+
+        # Open remote connections while the user is still filling in the source
+        def on_source_changed(index):
+            if source_combo.itemText(index) == gitlab_label:
+                self._warm_http_connection(self._GITLAB_WARMUP_URL)
+        source_combo.currentIndexChanged.connect(on_source_changed)
+        file_path.editingFinished.connect(lambda: self._warm_http_connection(file_path.text().strip()))
         
         # Firmware Configuration Guide
         # Toggle Button
@@ -2941,29 +3516,37 @@ Please find the attached Excel report with complete device information including
         firmware_guide_group = QGroupBox("Firmware Flashing Guide")
         firmware_guide_layout = QVBoxLayout()
         
-        # Supported Formats Guide
-        formats_guide = QLabel("""
-        <b>[FORMATS] Supported Firmware Formats:</b><br>
-        • <b>.bin files:</b> Binary firmware files (most common)<br>
-        • <b>.elf files:</b> Executable and Linkable Format files<br>
-        • <b>URL downloads:</b> Direct download from web URLs<br>
-        • <b>GitLab repositories:</b> Download from GitLab CI/CD artifacts
-        """)
-        formats_guide.setStyleSheet("color: #333; font-size: 10px; background: #f0f8ff; padding: 8px; border-radius: 4px; border: 1px solid #b0d4f1;")
-        firmware_guide_layout.addWidget(formats_guide)
-        
-        # Board-Specific Guide
-        board_guide = QLabel(QCoreApplication.translate("MainWindow", """
+        firmware_guide_group.setLayout(firmware_guide_layout)
+        firmware_guide_group.setVisible(False)  # Initially hidden
+        layout.addWidget(firmware_guide_group)
+
+        def build_guides():
+            """Create the rich-text guide labels; deferred until the guide is first shown."""
+            # Supported Formats Guide
+            # No links or translations here, so plain text avoids the rich-text layout
+            formats_guide = QLabel(
+                "[FORMATS] Supported Firmware Formats:\n"
+                "• .bin files: Binary firmware files (most common)\n"
+                "• .elf files: Executable and Linkable Format files\n"
+                "• URL downloads: Direct download from web URLs\n"
+                "• GitLab repositories: Download from GitLab CI/CD artifacts"
+            )
+            formats_guide.setTextFormat(Qt.PlainText)
+            formats_guide.setObjectName("GuideInfo")
+            firmware_guide_layout.addWidget(formats_guide)
+
+            # Board-Specific Guide
+            board_guide = QLabel(QCoreApplication.translate("MainWindow", """
         <b>[BOARD] Board-Specific Requirements:</b><br>
         • <b>STM32:</b> Requires STM32CubeProgrammer or OpenOCD<br>
         • <b>Arduino:</b> Uses avrdude for AVR-based boards<br>
         • <b>Generic:</b> Basic serial communication support
         """))
-        board_guide.setStyleSheet("color: #333; font-size: 10px; background: #fff0f0; padding: 8px; border-radius: 4px; border: 1px solid #f1b0b0;")
-        firmware_guide_layout.addWidget(board_guide)
-        
-        # Troubleshooting Guide
-        firmware_troubleshooting_guide = QLabel(QCoreApplication.translate("MainWindow", """
+            board_guide.setObjectName("GuideWarn")
+            firmware_guide_layout.addWidget(board_guide)
+
+            # Troubleshooting Guide
+            firmware_troubleshooting_guide = QLabel(QCoreApplication.translate("MainWindow", """
         <b>[TROUBLESHOOTING] Firmware Flashing Troubleshooting:</b><br>
         • <b>Device not found:</b> Check USB connection and drivers<br>
         • <b>Permission denied:</b> Run as administrator (Windows) or use sudo (Linux)<br>
@@ -2971,16 +3554,14 @@ Please find the attached Excel report with complete device information including
         • <b>Wrong file format:</b> Ensure file matches board type<br>
         • <b>Still having issues?</b> Check: <a href="https://www.st.com/en/development-tools/stm32cubeprog.html">STM32 Docs</a>
         """))
-        firmware_troubleshooting_guide.setOpenExternalLinks(True)
-        firmware_troubleshooting_guide.setStyleSheet("color: #333; font-size: 10px; background: #fff8f0; padding: 8px; border-radius: 4px; border: 1px solid #f1d0b0;")
-        firmware_guide_layout.addWidget(firmware_troubleshooting_guide)
-        
-        firmware_guide_group.setLayout(firmware_guide_layout)
-        firmware_guide_group.setVisible(False)  # Initially hidden
-        layout.addWidget(firmware_guide_group)
+            firmware_troubleshooting_guide.setOpenExternalLinks(True)
+            firmware_troubleshooting_guide.setObjectName("GuideTip")
+            firmware_guide_layout.addWidget(firmware_troubleshooting_guide)
 
         # Connect toggle button
         def on_guide_toggle(checked):
+            if checked and firmware_guide_layout.count() == 0:
+                build_guides()
             firmware_guide_group.setVisible(checked)
             toggle_guide_btn.setText("Hide Firmware Flashing Guide ▼" if checked else "Show Firmware Flashing Guide ➤")
             
@@ -3182,7 +3763,7 @@ Please find the attached Excel report with complete device information including
         url_version_layout = QHBoxLayout()
         url_version_layout.addWidget(QLabel(QCoreApplication.translate("MainWindow", "Version:")))
         firmware_version = QLineEdit()
-        firmware_version.setPlaceholderText("1.0.0")
+        firmware_version.setPlaceholderText(self._PH_FIRMWARE_VERSION)
         url_version_layout.addWidget(firmware_version)
         url_layout.addLayout(url_version_layout)
         
@@ -3300,6 +3881,22 @@ Please find the attached Excel report with complete device information including
             status_label.setStyleSheet("color: red;")
             logger.error(f"Enhanced flashing error: {e}")
     
+    def _warm_http_connection(self, url: str):
+        """Open a pooled connection to url's host in the background, once per host."""
+        qurl = QUrl(url)
+        if qurl.scheme() not in ('http', 'https') or not qurl.host():
+            return
+        origin = f"{qurl.scheme()}://{qurl.host()}"
+        if origin in self._warmed_origins:
+            return
+        self._warmed_origins.add(origin)
+        session = self.firmware_flasher.firmware_manager.http_session
+        # Best effort: a failed warm-up just means the real request connects itself
+        self._start_pool_task(
+            PoolTask(session.head, origin, timeout=5),
+            on_error=lambda error: logger.debug(f"Connection warm-up to {origin} failed: {error}")
+        )
+
     def _flash_local_file(self, device, file_path, erase_flash, verify_flash, backup_flash, 
                          progress_bar, status_label):
         """Flash firmware from local file."""
@@ -3466,6 +4063,42 @@ Please find the attached Excel report with complete device information including
             status_label.setStyleSheet("color: red;")
             logger.error(f"Database flashing error: {e}")
     
+    @staticmethod
+    def _fill_list_widget(list_widget, items, clear=True):
+        """Add items to list_widget, replacing its contents unless clear is False; repaints once at the end."""
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            if clear:
+                list_widget.clear()
+            for item in items:
+                list_widget.addItem(item)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+
+    def _confirm_then(self, parent, title, text, on_yes):
+        """Ask a Yes/No question without a nested event loop; on_yes runs if the user confirms."""
+        box = QMessageBox(QMessageBox.Question, title, text, QMessageBox.Yes | QMessageBox.No, parent)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(
+            lambda _: on_yes() if box.standardButton(box.clickedButton()) == QMessageBox.Yes else None)
+        box.open()
+
+    @staticmethod
+    def _health_band(score):
+        """Return the (threshold, brush, style) band a health score falls in."""
+        for band in MainWindow._HEALTH_BANDS:
+            if score >= band[0]:
+                return band
+        return MainWindow._HEALTH_BANDS[-1]
+
+    @staticmethod
+    def _apply_style(widget, style):
+        """Set widget's stylesheet unless it already has exactly that one."""
+        if widget.styleSheet() != style:
+            widget.setStyleSheet(style)
+
     def _update_firmware_status(self, device_list):
         """Update firmware status for selected device."""
         current_item = device_list.currentItem()
@@ -3590,27 +4223,34 @@ Please find the attached Excel report with complete device information including
         self.flash_progress_dialog.setRange(0, 0) # Indeterminate
         self.flash_progress_dialog.show()
         
-        # Show progress
+        # Show progress; the bar stays busy until the flasher reports a percentage
         self.flash_progress.setVisible(True)
-        self.flash_progress.setValue(0)
+        self.flash_progress.setRange(0, 0)
         self.flash_status.setText("Preparing to flash...")
         
-        # Connect progress signal
-        try:
-            self.firmware_flasher.progress_update.disconnect(self._on_flash_progress_update)
-        except Exception:
-            pass
-        self.firmware_flasher.progress_update.connect(self._on_flash_progress_update)
-        
         try:
-            # Start flashing in a separate thread
-            self.flash_thread = WorkerThread(
+            # Flashing takes minutes, so it gets its own thread rather than holding a pool
+            # thread that device scans and other short tasks need; progress arrives queued
+            # The coalescer only calls emit once the thread runs, after flash_thread is bound
+            progress = _ProgressCoalescer(lambda msg: flash_thread.progress.emit(msg))
+            flash_thread = self.flash_thread = WorkerThread(
                 self._flash_firmware_worker,
-                device, firmware_source, erase_flash, verify_flash, boot_mode
+                device, firmware_source, erase_flash, verify_flash, boot_mode,
+                progress_callback=progress
             )
+            self.flash_thread.progress.connect(self._on_flash_progress_update, Qt.QueuedConnection)
+            # Trailing flush so a message held back by the coalescer still shows while the job runs
+            flush_timer = QTimer(dialog)
+            flush_timer.setInterval(self.PROGRESS_FLUSH_MS)
+            flush_timer.timeout.connect(progress.flush)
+            self.flash_thread.finished.connect(flush_timer.stop)
+            if self._onedrive_enabled:
+                self.flash_thread.succeeded.connect(
+                    lambda: self._save_flashed_firmware_to_onedrive(firmware_source))
             self.flash_thread.succeeded.connect(lambda: self._flash_completed(dialog, True))
             self.flash_thread.error.connect(lambda error: self._flash_completed(dialog, False, error))
             self.flash_thread.start()
+            flush_timer.start()
             
         except Exception as e:
             if hasattr(self, 'flash_progress_dialog') and self.flash_progress_dialog:
@@ -3622,62 +4262,88 @@ Please find the attached Excel report with complete device information including
         """Handle progress updates for flashing dialog."""
         if hasattr(self, 'flash_status') and self.flash_status:
             self.flash_status.setText(msg)
-        if hasattr(self, 'flash_progress') and self.flash_progress:
-            val = self.flash_progress.value() + 5
-            if val > 100: val = 5
-            self.flash_progress.setValue(val)
+        match = self._PERCENT_RE.search(msg)
+        if match and hasattr(self, 'flash_progress') and self.flash_progress:
+            self.flash_progress.setRange(0, 100)
+            self.flash_progress.setValue(min(100, int(float(match.group(1)))))
         if hasattr(self, 'flash_progress_dialog') and self.flash_progress_dialog:
             self.flash_progress_dialog.setLabelText(msg)
 
-    def _flash_firmware_worker(self, device, firmware_source, erase_flash, verify_flash, boot_mode):
-        """Worker function for firmware flashing."""
+    def _flash_firmware_worker(self, device, firmware_source, erase_flash, verify_flash, boot_mode,
+                               progress_callback=None):
+        """Worker function for firmware flashing.
+
+        progress_callback is called from this thread; pass a signal's emit so the UI
+        receives the messages on its own thread. The OneDrive copy is started separately
+        by _save_flashed_firmware_to_onedrive once the flash has succeeded.
+        """
+        progress_callback = progress_callback or (lambda msg: None)
         try:
             # Flash the firmware
             success = self.firmware_flasher.flash_firmware(
                 device=device,
                 firmware_source=firmware_source,
-                progress_callback=None # Use signals instead
+                progress_callback=progress_callback
             )
             
-            if success:
-                # Save firmware to OneDrive if enabled
-                if self.onedrive_manager.is_enabled():
-                    # We can't emit signal directly from here easily without callback, 
-                    # but FirmwareFlasher handles flashing signals.
-                    # For OneDrive, we might miss progress updates if we don't emit them.
-                    # But FirmwareFlasher doesn't know about OneDrive here.
-                    # We can use self.firmware_flasher.progress_update.emit() if we wanted, 
-                    # but we are in a thread. 
-                    # Actually, FirmwareFlasher is a QObject, so emitting its signal from another thread is fine.
-                    self.firmware_flasher.progress_update.emit("Saving firmware to OneDrive...")
-                    
-                    _p = Path(firmware_source)
-                    firmware_info = {
-                        "name": _p.name,
-                        "version": "Unknown",
-                        "path": str(_p) if _p.exists() else "",
-                        "url": "" if _p.exists() else firmware_source,
-                        "size": _p.stat().st_size if _p.exists() else 0,
-                        "hash": ""
-                    }
-                    
-                    onedrive_success = self.onedrive_manager.save_firmware_file(
-                        operator_name=getattr(self, 'operator_name', type('obj', (object,), {'text': lambda: ''})()).text(),
-                        machine_type=getattr(self, 'machine_type', type('obj', (object,), {'currentText': lambda: ''})()).currentText(),
-                        machine_id=getattr(self, 'machine_id', type('obj', (object,), {'text': lambda: ''})()).text(),
-                        firmware_path=_p if _p.exists() else Path(),
-                        firmware_info=firmware_info
-                    )
-                    
-                    if onedrive_success:
-                        self.firmware_flasher.progress_update.emit(QCoreApplication.translate("MainWindow", "[SUCCESS] Firmware saved to OneDrive"))
-                    else:
-                        self.firmware_flasher.progress_update.emit(QCoreApplication.translate("MainWindow", "[WARNING] OneDrive firmware save failed"))
-            else:
+            if not success:
                 raise Exception(QCoreApplication.translate("MainWindow", "Firmware flashing failed"))
                 
         except Exception as e:
             raise Exception(QCoreApplication.translate("MainWindow", "Flashing error: {}").format(str(e)))
+        finally:
+            # Queue the last held-back message ahead of the finished/error signal
+            flush = getattr(progress_callback, 'flush', None)
+            if flush:
+                flush()
+
+    def _save_flashed_firmware_to_onedrive(self, firmware_source):
+        """Copy a flashed firmware file to OneDrive on the thread pool.
+
+        Widget values are read here on the GUI thread; the copy itself does not hold up
+        the flash result.
+        """
+        operator_name = self.operator_name.text()
+        machine_type = self.machine_type.currentText()
+        machine_id = self.machine_id.text()
+        onedrive_manager = self.onedrive_manager
+
+        def save():
+            _p = Path(firmware_source)
+            try:
+                size = _p.stat().st_size
+                is_local = True
+            except OSError:
+                size = 0
+                is_local = False
+            firmware_info = {
+                "name": _p.name,
+                "version": "Unknown",
+                "path": str(_p) if is_local else "",
+                "url": "" if is_local else firmware_source,
+                "size": size,
+                "hash": ""
+            }
+            return onedrive_manager.save_firmware_file(
+                operator_name=operator_name,
+                machine_type=machine_type,
+                machine_id=machine_id,
+                firmware_path=_p if is_local else Path(),
+                firmware_info=firmware_info
+            )
+
+        def on_finished(onedrive_success):
+            if onedrive_success:
+                self.log(QCoreApplication.translate("MainWindow", "[SUCCESS] Firmware saved to OneDrive"))
+            else:
+                self.log(QCoreApplication.translate("MainWindow", "[WARNING] OneDrive firmware save failed"))
+
+        def on_error(error):
+            logger.warning(f"OneDrive firmware save failed: {error}")
+            self.log(QCoreApplication.translate("MainWindow", "[WARNING] OneDrive firmware save failed"))
+
+        self.log("Saving firmware to OneDrive...")
+        self._start_pool_task(PoolTask(save), on_finished=on_finished, on_error=on_error)
 
     def _flash_completed(self, dialog, success: bool, error: str = ""):
         # Close progress popup
@@ -3686,6 +4352,7 @@ Please find the attached Excel report with complete device information including
             self.flash_progress_dialog = None
 
         try:
+            self.flash_progress.setRange(0, 100)
             self.flash_progress.setVisible(False)
             if success:
                 self.flash_status.setText(QCoreApplication.translate("MainWindow", "Flash completed"))
@@ -3702,10 +4369,48 @@ Please find the attached Excel report with complete device information including
         except Exception:
             pass
     
+    def _refresh_machine_types_cache(self):
+        """Re-read machine types from config; call after every machine type edit."""
+        self._machine_types_cache = Config.get_machine_types(self.config)
+        # Per-type suffix editor settings so switching types is a dict lookup
+        self._machine_id_hints = {}
+        for name, type_cfg in self._machine_types_cache.items():
+            prefix = type_cfg.get('prefix', '')
+            remaining = max(0, type_cfg.get('length', 0) - len(prefix))
+            examples = [
+                "0" * remaining,
+                "1" * remaining,
+                ("1234567890"[:remaining] if remaining > 0 else ""),
+                "9" * remaining,
+            ]
+            self._machine_id_hints[name] = {
+                'prefix': prefix,
+                'length': type_cfg.get('length', 0),
+                'regex': fr"^\d{{{remaining}}}$",
+                # Filter empty or duplicates
+                'examples': [e for i, e in enumerate(examples) if e and e not in examples[:i]],
+                'placeholder': f"e.g., {prefix}{'X' * remaining}",
+                'suffix_placeholder': "0" * remaining,
+            }
+
+    def _refresh_settings_cache(self):
+        """Cache config values read on the flash path; call again after saving them."""
+        self._onedrive_enabled = self.config.get('onedrive', {}).get('enabled', False)
+        self._operator_name = self.config.get('operator', {}).get('name', 'Unknown')
+
+    def _suffix_validator(self, prefix: str, length: int, pattern: str) -> QRegularExpressionValidator:
+        """Return the machine ID suffix validator, compiling its regex once per type shape."""
+        key = (prefix, length)
+        validator = self._validator_cache.get(key)
+        if validator is None:
+            validator = QRegularExpressionValidator(QRegularExpression(pattern), self)
+            self._validator_cache[key] = validator
+        return validator
+
     def update_machine_type_combo(self):
         """Update machine type combo box with current config."""
         self.machine_type.clear()
-        machine_types = Config.get_machine_types(self.config)
+        machine_types = self._machine_types_cache
         self.machine_type.addItems(list(machine_types.keys()))
     
     def configure_machine_types_dialog(self):
@@ -3737,6 +4442,7 @@ Please find the attached Excel report with complete device information including
         list_layout = QVBoxLayout()
         
         self.machine_types_list = QListWidget()
+        self._mt_items = {}  # Machine type name -> its item in machine_types_list
         self.populate_machine_types_list()
         list_layout.addWidget(self.machine_types_list)
         
@@ -3759,24 +4465,43 @@ Please find the attached Excel report with complete device information including
         list_group.setLayout(list_layout)
         machine_layout.addWidget(list_group)
         
-        # Machine Types Configuration Guide
+        # Machine Types Configuration Guide (Collapsible)
+        toggle_guide_btn = QPushButton("Show Machine Types Guide")
+        toggle_guide_btn.setCheckable(True)
+        toggle_guide_btn.setChecked(False)
+        machine_layout.addWidget(toggle_guide_btn)
+
         machine_guide_group = QGroupBox("[GUIDE] Machine Types Configuration Guide")
+        machine_guide_group.setVisible(False)
         machine_guide_layout = QVBoxLayout()
+
+        def update_guide_btn_text(checked):
+            toggle_guide_btn.setText("Hide Machine Types Guide" if checked else "Show Machine Types Guide")
+
+        def on_guide_toggle(checked):
+            if checked and machine_guide_layout.count() == 0:
+                build_guides()
+            machine_guide_group.setVisible(checked)
+
+        toggle_guide_btn.toggled.connect(on_guide_toggle)
+        toggle_guide_btn.toggled.connect(update_guide_btn_text)
         
-        # Basic Configuration Guide
-        basic_config_guide = QLabel("""
+        def build_guides():
+            """Create the guide labels; deferred until the guide is first shown."""
+            # Basic Configuration Guide
+            basic_config_guide = QLabel("""
         <b>[CONFIGURATION] Machine Type Configuration:</b><br>
         • <b>Name:</b> Display name for the machine type (e.g., "Amphore", "BOKs")<br>
         • <b>Prefix:</b> Required prefix for machine IDs (e.g., "AMP-", "BOK-")<br>
         • <b>Length:</b> Total length of machine ID including prefix<br><br>
         <b>Example:</b> Name="Amphore", Prefix="AMP-", Length=12 → IDs like "AMP-123456789"
         """)
-        basic_config_guide.setWordWrap(True)
-        basic_config_guide.setStyleSheet("color: #333; font-size: 10px; background: #f0f8ff; padding: 8px; border-radius: 4px; border: 1px solid #b0d4f1;")
-        machine_guide_layout.addWidget(basic_config_guide)
+            basic_config_guide.setWordWrap(True)
+            basic_config_guide.setObjectName("GuideInfo")
+            machine_guide_layout.addWidget(basic_config_guide)
         
-        # Best Practices Guide
-        best_practices_guide = QLabel("""
+            # Best Practices Guide
+            best_practices_guide = QLabel("""
         <b>[TIPS] Best Practices:</b><br>
         • Use consistent naming conventions (e.g., all caps for prefixes)<br>
         • Keep prefixes short but meaningful (2-4 characters)<br>
@@ -3784,21 +4509,21 @@ Please find the attached Excel report with complete device information including
         • Test validation before deploying to production<br>
         • Document your machine type standards for your team
         """)
-        best_practices_guide.setWordWrap(True)
-        best_practices_guide.setStyleSheet("color: #333; font-size: 10px; background: #fff0f0; padding: 8px; border-radius: 4px; border: 1px solid #f1b0b0;")
-        machine_guide_layout.addWidget(best_practices_guide)
+            best_practices_guide.setWordWrap(True)
+            best_practices_guide.setObjectName("GuideWarn")
+            machine_guide_layout.addWidget(best_practices_guide)
         
-        # Common Examples
-        examples_guide = QLabel("""
+            # Common Examples
+            examples_guide = QLabel("""
         <b>[EXAMPLES] Common Examples:</b><br>
         • <b>Water Dispenser:</b> Prefix="WD-", Length=14 → "WD-123456789012"<br>
         • <b>Amphore:</b> Prefix="AMP-", Length=12 → "AMP-123456789"<br>
         • <b>BOKs:</b> Prefix="BOK-", Length=10 → "BOK-1234567"<br>
         • <b>Custom:</b> Prefix="CUST-", Length=15 → "CUST-1234567890"
         """)
-        examples_guide.setWordWrap(True)
-        examples_guide.setStyleSheet("color: #333; font-size: 10px; background: #f0fff0; padding: 8px; border-radius: 4px; border: 1px solid #b0f1b0;")
-        machine_guide_layout.addWidget(examples_guide)
+            examples_guide.setWordWrap(True)
+            examples_guide.setObjectName("GuideSuccess")
+            machine_guide_layout.addWidget(examples_guide)
         
         machine_guide_group.setLayout(machine_guide_layout)
         machine_layout.addWidget(machine_guide_group)
@@ -3824,7 +4549,7 @@ Please find the attached Excel report with complete device information including
         test_type_layout = QHBoxLayout()
         test_type_layout.addWidget(QLabel(QCoreApplication.translate("MainWindow", "Machine Type:")))
         self.test_machine_type = QComboBox()
-        self.test_machine_type.addItems(list(Config.get_machine_types(self.config).keys()))
+        self.test_machine_type.addItems(list(self._machine_types_cache.keys()))
         test_type_layout.addWidget(self.test_machine_type)
         test_layout.addLayout(test_type_layout)
         
@@ -3840,7 +4565,7 @@ Please find the attached Excel report with complete device information including
         test_layout.addWidget(test_btn)
         
         self.validation_result = QLabel(QCoreApplication.translate("MainWindow", "Enter a machine ID to test validation"))
-        self.validation_result.setStyleSheet("color: #666; font-size: 12px; padding: 10px; border: 1px solid #ccc; border-radius: 5px;")
+        self.validation_result.setStyleSheet(self._STYLE_RESULT_NEUTRAL)
         test_layout.addWidget(self.validation_result)
         
         test_group.setLayout(test_layout)
@@ -3867,15 +4592,31 @@ Please find the attached Excel report with complete device information including
             self.on_machine_type_changed(current_type)
     
     def populate_machine_types_list(self):
-        """Populate the machine types list widget."""
-        self.machine_types_list.clear()
-        machine_types = Config.get_machine_types(self.config)
+        """Sync the machine types list widget with the cache, touching only changed rows."""
+        machine_types = self._machine_types_cache
+        list_widget = self.machine_types_list
         
-        for name, config in machine_types.items():
-            item_text = f"{name} - Prefix: '{config['prefix']}' - Length: {config['length']}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, name)
-            self.machine_types_list.addItem(item)
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            for name in [n for n in self._mt_items if n not in machine_types]:
+                list_widget.takeItem(list_widget.row(self._mt_items.pop(name)))
+            for row, (name, config) in enumerate(machine_types.items()):
+                item_text = f"{name} - Prefix: '{config['prefix']}' - Length: {config['length']}"
+                item = self._mt_items.get(name)
+                if item is None:
+                    item = QListWidgetItem(item_text)
+                    item.setData(Qt.UserRole, name)
+                    self._mt_items[name] = item
+                    list_widget.insertItem(row, item)
+                    continue
+                if item.text() != item_text:
+                    item.setText(item_text)
+                if list_widget.row(item) != row:
+                    list_widget.insertItem(row, list_widget.takeItem(list_widget.row(item)))
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
     
     def add_machine_type_dialog(self, parent_dialog):
         """Open dialog to add new machine type."""
@@ -3888,13 +4629,13 @@ Please find the attached Excel report with complete device information including
         # Name
         layout.addWidget(QLabel("Machine Type Name:"))
         name_input = QLineEdit()
-        name_input.setPlaceholderText("e.g., NewMachine")
+        name_input.setPlaceholderText(self._PH_MACHINE_NAME)
         layout.addWidget(name_input)
         
         # Prefix
         layout.addWidget(QLabel("ID Prefix:"))
         prefix_input = QLineEdit()
-        prefix_input.setPlaceholderText("e.g., NM-")
+        prefix_input.setPlaceholderText(self._PH_MACHINE_PREFIX)
         layout.addWidget(prefix_input)
         
         # Length
@@ -3906,7 +4647,7 @@ Please find the attached Excel report with complete device information including
         
         # Preview
         preview_label = QLabel("Preview: NM-1234567")
-        preview_label.setStyleSheet("color: #666; font-style: italic;")
+        preview_label.setStyleSheet(self._STYLE_PREVIEW)
         layout.addWidget(preview_label)
         
         def update_preview():
@@ -3919,8 +4660,12 @@ Please find the attached Excel report with complete device information including
             else:
                 preview_label.setText("Invalid: Length must be greater than prefix length")
         
-        prefix_input.textChanged.connect(update_preview)
-        length_input.valueChanged.connect(update_preview)
+        preview_timer = QTimer(dialog)
+        preview_timer.setSingleShot(True)
+        preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        preview_timer.timeout.connect(update_preview)
+        prefix_input.textChanged.connect(lambda _: preview_timer.start())
+        length_input.valueChanged.connect(lambda _: preview_timer.start())
         
         # Buttons
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -3945,7 +4690,8 @@ Please find the attached Excel report with complete device information including
             
             # Add to config
             self.config = Config.add_machine_type(self.config, name, prefix, length)
-            Config.save_config(self.config)
+            self._save_config_now()
+            self._refresh_machine_types_cache()
             
             # Refresh lists
             self.populate_machine_types_list()
@@ -3959,7 +4705,7 @@ Please find the attached Excel report with complete device information including
             return
         
         old_name = current_item.data(Qt.UserRole)
-        machine_types = Config.get_machine_types(self.config)
+        machine_types = self._machine_types_cache
         old_config = machine_types[old_name]
         
         dialog = QDialog(parent_dialog)
@@ -3998,13 +4744,17 @@ Please find the attached Excel report with complete device information including
             if remaining > 0:
                 preview = prefix + "X" * remaining
                 preview_label.setText(f"Preview: {preview}")
-                preview_label.setStyleSheet("color: #666; font-style: italic;")
+                self._apply_style(preview_label, self._STYLE_PREVIEW)
             else:
                 preview_label.setText("Invalid: Length must be greater than prefix length")
-                preview_label.setStyleSheet("color: red; font-style: italic;")
-        
-        prefix_input.textChanged.connect(update_preview)
-        length_input.valueChanged.connect(update_preview)
+                self._apply_style(preview_label, self._STYLE_PREVIEW_INVALID)
+        
+        preview_timer = QTimer(dialog)
+        preview_timer.setSingleShot(True)
+        preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        preview_timer.timeout.connect(update_preview)
+        prefix_input.textChanged.connect(lambda _: preview_timer.start())
+        length_input.valueChanged.connect(lambda _: preview_timer.start())
         update_preview()  # Initial update
         
         # Buttons
@@ -4030,7 +4780,8 @@ Please find the attached Excel report with complete device information including
             
             # Update config
             self.config = Config.update_machine_type(self.config, old_name, new_name, prefix, length)
-            Config.save_config(self.config)
+            self._save_config_now()
+            self._refresh_machine_types_cache()
             
             # Refresh lists
             self.populate_machine_types_list()
@@ -4045,21 +4796,22 @@ Please find the attached Excel report with complete device information including
         
         name = current_item.data(Qt.UserRole)
         
-        reply = QMessageBox.question(
-            parent_dialog, 
-            "Confirm Delete", 
-            f"Are you sure you want to delete the machine type '{name}'?\n\nThis action cannot be undone.",
-            QMessageBox.Yes | QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
+        def delete():
             # Delete from config
             self.config = Config.delete_machine_type(self.config, name)
-            Config.save_config(self.config)
+            self._save_config_now()
+            self._refresh_machine_types_cache()
             
             # Refresh lists
             self.populate_machine_types_list()
             QMessageBox.information(parent_dialog, "Success", f"Machine type '{name}' deleted successfully!")
+        
+        self._confirm_then(
+            parent_dialog, 
+            "Confirm Delete", 
+            f"Are you sure you want to delete the machine type '{name}'?\n\nThis action cannot be undone.",
+            delete
+        )
     
     def test_machine_id_validation(self):
         """Test machine ID validation."""
@@ -4068,25 +4820,25 @@ Please find the attached Excel report with complete device information including
         
         if not machine_id:
             self.validation_result.setText("Please enter a machine ID to test")
-            self.validation_result.setStyleSheet("color: #666; font-size: 12px; padding: 10px; border: 1px solid #ccc; border-radius: 5px;")
+            self._apply_style(self.validation_result, self._STYLE_RESULT_NEUTRAL)
             return
         
-        machine_types = Config.get_machine_types(self.config)
+        machine_types = self._machine_types_cache
         machine_type_config = machine_types.get(machine_type_name)
         
         if not machine_type_config:
             self.validation_result.setText("Error: Machine type configuration not found")
-            self.validation_result.setStyleSheet("color: red; font-size: 12px; padding: 10px; border: 1px solid #ccc; border-radius: 5px;")
+            self._apply_style(self.validation_result, self._STYLE_RESULT_ERR)
             return
         
         is_valid, message = Config.validate_machine_id(machine_id, machine_type_config)
         
         if is_valid:
             self.validation_result.setText(f"[SUCCESS] Valid: {message}")
-            self.validation_result.setStyleSheet("color: green; font-size: 12px; padding: 10px; border: 1px solid #ccc; border-radius: 5px;")
+            self._apply_style(self.validation_result, self._STYLE_RESULT_OK)
         else:
             self.validation_result.setText(f"[INVALID] Invalid: {message}")
-            self.validation_result.setStyleSheet("color: red; font-size: 12px; padding: 10px; border: 1px solid #ccc; border-radius: 5px;")
+            self._apply_style(self.validation_result, self._STYLE_RESULT_ERR)
     
     def configure_onedrive_dialog(self):
         """Open OneDrive configuration dialog."""
@@ -4138,7 +4890,7 @@ Please find the attached Excel report with complete device information including
         folder_layout = QHBoxLayout()
         self.onedrive_folder_path = QLineEdit()
         self.onedrive_folder_path.setText(self.config.get('onedrive', {}).get('folder_path', ''))
-        self.onedrive_folder_path.setPlaceholderText("e.g., C:\\Users\\Username\\OneDrive\\SharedFolder")
+        self.onedrive_folder_path.setPlaceholderText(self._PH_ONEDRIVE_FOLDER)
         self.onedrive_folder_path.setToolTip("The root folder where user/machine subfolders will be created.")
         self.onedrive_folder_path.textChanged.connect(self._validate_onedrive_inputs)
         folder_layout.addWidget(self.onedrive_folder_path)
@@ -4167,7 +4919,7 @@ Please find the attached Excel report with complete device information including
         path_layout.addWidget(QLabel("User Folder Name:"))
         self.user_folder_name = QLineEdit()
         self.user_folder_name.setText(self.config.get('onedrive', {}).get('user_folder', ''))
-        self.user_folder_name.setPlaceholderText("e.g., JohnDoe_Work")
+        self.user_folder_name.setPlaceholderText(self._PH_USER_FOLDER)
         self.user_folder_name.setToolTip("Your personal subfolder under the shared OneDrive path (e.g., JohnDoe_Work).")
         self.user_folder_name.textChanged.connect(self._validate_onedrive_inputs)
         path_layout.addWidget(self.user_folder_name)
@@ -4201,10 +4953,11 @@ Please find the attached Excel report with complete device information including
         
         test_btn = QPushButton("Test OneDrive Connection")
         test_btn.clicked.connect(self.test_onedrive_connection)
+        self._onedrive_test_btn = test_btn
         test_layout.addWidget(test_btn)
         
         self.onedrive_test_result = QLabel("Click 'Test Connection' to verify OneDrive access")
-        self.onedrive_test_result.setStyleSheet("color: #666; font-size: 12px; padding: 10px; border: 1px solid #ccc; border-radius: 5px;")
+        self.onedrive_test_result.setStyleSheet(self._STYLE_RESULT_NEUTRAL)
         test_layout.addWidget(self.onedrive_test_result)
         
         test_group.setLayout(test_layout)
@@ -4222,7 +4975,12 @@ Please find the attached Excel report with complete device information including
         def update_guide_btn_text(checked):
             toggle_guide_btn.setText("Hide OneDrive Guide" if checked else "Show OneDrive Guide")
             
-        toggle_guide_btn.toggled.connect(onedrive_guide_group.setVisible)
+        def on_guide_toggle(checked):
+            if checked and guide_content_layout.count() == 0:
+                build_guides()
+            onedrive_guide_group.setVisible(checked)
+
+        toggle_guide_btn.toggled.connect(on_guide_toggle)
         toggle_guide_btn.toggled.connect(update_guide_btn_text)
 
         onedrive_guide_layout = QVBoxLayout()
@@ -4237,43 +4995,25 @@ Please find the attached Excel report with complete device information including
         guide_content_layout = QVBoxLayout(guide_content)
         guide_content_layout.setContentsMargins(0, 0, 0, 0)
         
-        # OneDrive Setup Guide
-        onedrive_setup_guide = QLabel("""
-        <b>[ONEDRIVE] OneDrive Setup:</b><br>
-        1. Install OneDrive: <a href="https://www.microsoft.com/en-us/microsoft-365/onedrive/download">Download OneDrive</a><br>
-        2. Sign in to your Microsoft account<br>
-        3. Create a shared folder or use existing OneDrive folder<br>
-        4. Copy the full path to your OneDrive folder<br>
-        5. Test the connection to verify access
-        """)
-        onedrive_setup_guide.setOpenExternalLinks(True)
-        onedrive_setup_guide.setStyleSheet("color: #333; font-size: 10px; background: #f0f8ff; padding: 8px; border-radius: 4px; border: 1px solid #b0d4f1;")
-        guide_content_layout.addWidget(onedrive_setup_guide)
-        
-        # Alternative Cloud Services
-        cloud_alternatives_guide = QLabel("""
-        <b>[ALTERNATIVES] Alternative Cloud Services:</b><br>
-        • <b>Google Drive:</b> <a href="https://drive.google.com">drive.google.com</a> - Use Google Drive folder path<br>
-        • <b>Dropbox:</b> <a href="https://www.dropbox.com">dropbox.com</a> - Use Dropbox folder path<br>
-        • <b>iCloud:</b> <a href="https://www.icloud.com">icloud.com</a> - Use iCloud folder path<br>
-        • <b>Network Drive:</b> Use UNC path (\\\\server\\share) for network storage
-        """)
-        cloud_alternatives_guide.setOpenExternalLinks(True)
-        cloud_alternatives_guide.setStyleSheet("color: #333; font-size: 10px; background: #fff0f0; padding: 8px; border-radius: 4px; border: 1px solid #f1b0b0;")
-        guide_content_layout.addWidget(cloud_alternatives_guide)
-        
-        # Troubleshooting
-        onedrive_troubleshooting_guide = QLabel("""
-        <b>[TROUBLESHOOTING] OneDrive Troubleshooting:</b><br>
-        • <b>Access Denied:</b> Check folder permissions and sharing settings<br>
-        • <b>Path Not Found:</b> Verify the folder path exists and is accessible<br>
-        • <b>Sync Issues:</b> Ensure OneDrive is running and synced<br>
-        • <b>Network Issues:</b> Check internet connection and firewall settings<br>
-        • <b>Still having issues?</b> Try: <a href="https://support.microsoft.com/en-us/onedrive">OneDrive Support</a>
-        """)
-        onedrive_troubleshooting_guide.setOpenExternalLinks(True)
-        onedrive_troubleshooting_guide.setStyleSheet("color: #333; font-size: 10px; background: #fff8f0; padding: 8px; border-radius: 4px; border: 1px solid #f1d0b0;")
-        guide_content_layout.addWidget(onedrive_troubleshooting_guide)
+        def build_guides():
+            """Create the guide labels; deferred until the guide is first shown."""
+            # OneDrive Setup Guide
+            onedrive_setup_guide = QLabel(_ONEDRIVE_GUIDE_HTML['setup'])
+            onedrive_setup_guide.setOpenExternalLinks(True)
+            onedrive_setup_guide.setObjectName("GuideInfo")
+            guide_content_layout.addWidget(onedrive_setup_guide)
+        
+            # Alternative Cloud Services
+            cloud_alternatives_guide = QLabel(_ONEDRIVE_GUIDE_HTML['alternatives'])
+            cloud_alternatives_guide.setOpenExternalLinks(True)
+            cloud_alternatives_guide.setObjectName("GuideWarn")
+            guide_content_layout.addWidget(cloud_alternatives_guide)
+        
+            # Troubleshooting
+            onedrive_troubleshooting_guide = QLabel(_ONEDRIVE_GUIDE_HTML['troubleshooting'])
+            onedrive_troubleshooting_guide.setOpenExternalLinks(True)
+            onedrive_troubleshooting_guide.setObjectName("GuideTip")
+            guide_content_layout.addWidget(onedrive_troubleshooting_guide)
         
         guide_scroll.setWidget(guide_content)
         onedrive_guide_layout.addWidget(guide_scroll)
@@ -4290,36 +5030,8 @@ Please find the attached Excel report with complete device information including
         structure_layout = QVBoxLayout()
         
         # Folder structure explanation
-        structure_info = QLabel("""
-        <b>OneDrive Folder Structure:</b><br><br>
-        
-        <b>Base Folder:</b> {OneDrive Shared Folder}<br>
-        ├── <b>User Folder:</b> {User Name}_Work<br>
-        │   ├── <b>Machine Type Folder:</b> {Machine Type}<br>
-        │   │   ├── <b>Machine ID Folder:</b> {Machine ID}<br>
-        │   │   │   ├── <b>Machine Data:</b> {Machine ID}_data.json<br>
-        │   │   │   └── <b>Firmware Folder:</b> firmware/<br>
-        │   │   │       ├── <b>Firmware Files:</b> {timestamp}_{firmware}.bin<br>
-        │   │   │       └── <b>Firmware Info:</b> {timestamp}_firmware_info.json<br>
-        │   │   └── <b>Another Machine:</b> {Another Machine ID}/<br>
-        │   └── <b>Another Machine Type:</b> {Another Type}/<br>
-        └── <b>Another User:</b> {Another User}_Work/<br><br>
-        
-        <b>Example:</b><br>
-        OneDrive/SharedFolder/<br>
-        ├── JohnDoe_Work/<br>
-        │   ├── Amphore/<br>
-        │   │   ├── AMP-1234567890/<br>
-        │   │   │   ├── AMP-1234567890_data.json<br>
-        │   │   │   └── firmware/<br>
-        │   │   │       ├── 20241028_143022_firmware_v2.1.bin<br>
-        │   │   │       └── 20241028_143022_firmware_info.json<br>
-        │   │   └── AMP-0987654321/<br>
-        │   └── BOKs/<br>
-        │       └── BOK-12345678/<br>
-        └── JaneSmith_Work/<br>
-        """)
-        structure_info.setStyleSheet("color: #333; font-size: 11px; background: #f9f9f9; padding: 15px; border-radius: 5px; border: 1px solid #ddd;")
+        structure_info = QLabel(_ONEDRIVE_STRUCTURE_HTML)
+        structure_info.setStyleSheet(_STRUCTURE_INFO_STYLE)
         structure_layout.addWidget(structure_info)
         
         structure_tab.setLayout(structure_layout)
@@ -4334,11 +5046,14 @@ Please find the attached Excel report with complete device information including
         history_list_layout = QVBoxLayout()
         
         self.machine_history_list = QListWidget()
-        self.populate_machine_history()
+        self.machine_history_list.verticalScrollBar().valueChanged.connect(self._on_machine_history_scrolled)
+        # A taller window can leave room for more rows without any scrolling
+        self.machine_history_list.verticalScrollBar().rangeChanged.connect(
+            lambda _min, _max: self._fill_machine_history_view())
         history_list_layout.addWidget(self.machine_history_list)
         
         refresh_history_btn = QPushButton("Refresh History")
-        refresh_history_btn.clicked.connect(self.populate_machine_history)
+        refresh_history_btn.clicked.connect(lambda: self.populate_machine_history(force_refresh=True))
         history_list_layout.addWidget(refresh_history_btn)
         
         history_group.setLayout(history_list_layout)
@@ -4347,6 +5062,19 @@ Please find the attached Excel report with complete device information including
         history_tab.setLayout(history_layout)
         tab_widget.addTab(history_tab, "Machine History")
         
+        # Add the live folder tree and list OneDrive machines only once their tab is first opened
+        folder_tree_checked = False
+
+        def on_tab_changed(index):
+            nonlocal folder_tree_checked
+            if tab_widget.widget(index) is structure_tab and not folder_tree_checked:
+                folder_tree_checked = True
+                self._add_onedrive_folder_tree(dialog, structure_layout)
+            elif tab_widget.widget(index) is history_tab and self.machine_history_list.count() == 0:
+                self.populate_machine_history()
+        
+        tab_widget.currentChanged.connect(on_tab_changed)
+        
         layout.addWidget(tab_widget)
         
         # Buttons
@@ -4434,21 +5162,34 @@ Please find the attached Excel report with complete device information including
             'auto_create_folders': self.auto_create_folders.isChecked()
         }
         
-        # Create temporary OneDrive manager for testing
-        temp_manager = OneDriveManager()
-        temp_manager.config = temp_config
-        
-        success, message = temp_manager.test_connection()
+        enabled = self.onedrive_enabled.isChecked()
         
+        def run_test():
+            # Separate manager on the unsaved settings, so the shared one is never swapped mid-use
+            from ..core.onedrive_manager import OneDriveManager
+            return OneDriveManager(temp_config).test_connection()
+        
+        self._onedrive_test_btn.setEnabled(False)
+        self.onedrive_test_result.setText("Testing OneDrive connection...")
+        self._apply_style(self.onedrive_test_result, self._STYLE_RESULT_NEUTRAL)
+        self._start_pool_task(
+            PoolTask(run_test),
+            on_finished=lambda result: self._show_onedrive_test_result(enabled, *result),
+            on_error=lambda error: self._show_onedrive_test_result(enabled, False, error),
+        )
+    
+    def _show_onedrive_test_result(self, enabled, success, message):
+        """Show the outcome of test_onedrive_connection and re-enable its button."""
+        self._onedrive_test_btn.setEnabled(True)
         if success:
             self.onedrive_test_result.setText(f"[SUCCESS] {message}")
-            self.onedrive_test_result.setStyleSheet("color:#0f5132;font-size:12px;padding:10px;border:1px solid #badbcc;border-radius:6px;background:#d1e7dd;")
-            self._update_onedrive_status_banner(enabled=self.onedrive_enabled.isChecked(), ok=True, text="OneDrive connected")
+            self._apply_style(self.onedrive_test_result, self._STYLE_ONEDRIVE_OK)
+            self._update_onedrive_status_banner(enabled=enabled, ok=True, text="OneDrive connected")
             self._update_onedrive_status_indicator()
         else:
             self.onedrive_test_result.setText(f"[ERROR] {message}")
-            self.onedrive_test_result.setStyleSheet("color:#842029;font-size:12px;padding:10px;border:1px solid #f5c2c7;border-radius:6px;background:#f8d7da;")
-            self._update_onedrive_status_banner(enabled=self.onedrive_enabled.isChecked(), ok=False, text="Connection failed")
+            self._apply_style(self.onedrive_test_result, self._STYLE_ONEDRIVE_ERR)
+            self._update_onedrive_status_banner(enabled=enabled, ok=False, text="Connection failed")
             self._update_onedrive_status_indicator()
     
     def save_onedrive_settings(self, dialog):
@@ -4461,17 +5202,38 @@ Please find the attached Excel report with complete device information including
             'auto_create_folders': self.auto_create_folders.isChecked()
         }
         
-        Config.save_config(self.config)
+        self._schedule_config_save()
+        self._refresh_settings_cache()
         
         # Update OneDrive manager
-        self.onedrive_manager.config = self.config
+        self.onedrive_manager.apply_config(self.config)
         
         QMessageBox.information(dialog, "Settings Saved", "OneDrive configuration saved successfully!")
         self._update_onedrive_status_banner(enabled=self.onedrive_enabled.isChecked(), ok=None, text="Settings updated")
         self._update_onedrive_status_indicator()
     
-    def populate_machine_history(self):
-        """Populate machine history list."""
+    def _add_onedrive_folder_tree(self, dialog, layout):
+        """Add a read-only tree of the OneDrive user folder when OneDrive is enabled and it exists.
+
+        QFileSystemModel lists a directory only when it is expanded, on its own thread.
+        """
+        if not self._onedrive_enabled:
+            return
+        user_folder = self.onedrive_manager.get_user_folder_path()
+        if not (user_folder and user_folder.is_dir()):
+            return
+        folder_model = QFileSystemModel(dialog)
+        folder_model.setReadOnly(True)
+        folder_view = QTreeView()
+        folder_view.setModel(folder_model)
+        folder_view.setRootIndex(folder_model.setRootPath(str(user_folder)))
+        folder_view.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        layout.addWidget(folder_view, 1)
+
+    def populate_machine_history(self, force_refresh=False):
+        """Populate machine history list; force_refresh bypasses the OneDrive listing cache."""
+        self._machine_history_pending = iter(())
+        self._machine_history_request = None
         self.machine_history_list.clear()
         
         if not self.onedrive_manager.is_enabled():
@@ -4480,7 +5242,23 @@ Please find the attached Excel report with complete device information including
             self.machine_history_list.addItem(item)
             return
         
-        machines = self.onedrive_manager.list_machines()
+        loading = QListWidgetItem("Loading machines from OneDrive...")
+        loading.setFlags(loading.flags() & ~Qt.ItemIsSelectable)
+        self.machine_history_list.addItem(loading)
+        
+        # Only the most recent listing is shown if Refresh is clicked again meanwhile
+        request = self._machine_history_request = object()
+        self._start_pool_task(
+            PoolTask(self.onedrive_manager.list_machines, force_refresh=force_refresh),
+            on_finished=lambda machines: self._show_machine_history(request, machines),
+            on_error=lambda error: self._show_machine_history(request, []),
+        )
+
+    def _show_machine_history(self, request, machines):
+        """Fill the machine history list with a listing fetched by populate_machine_history."""
+        if request is not self._machine_history_request:
+            return
+        self.machine_history_list.clear()
         
         if not machines:
             item = QListWidgetItem("No machines found in OneDrive")
@@ -4488,12 +5266,33 @@ Please find the attached Excel report with complete device information including
             self.machine_history_list.addItem(item)
             return
         
-        for machine in machines:
+        # Items are added a page at a time as the list is scrolled towards its end
+        self._machine_history_pending = iter(machines)
+        self._fill_machine_history_view()
+
+    def _fill_machine_history_view(self):
+        """Add pages until the history list can scroll, so scrolling can ask for the rest."""
+        bar = self.machine_history_list.verticalScrollBar()
+        while bar.maximum() == 0 and self._append_machine_history_page():
+            self.machine_history_list.doItemsLayout()
+
+    def _append_machine_history_page(self) -> bool:
+        """Add the next MACHINE_HISTORY_PAGE machines to the history list; False once none are left."""
+        items = []
+        for machine in islice(self._machine_history_pending, self.MACHINE_HISTORY_PAGE):
             timestamp = machine.get('timestamp', 'Unknown')
             item_text = f"{machine['machine_type']} - {machine['machine_id']} ({machine['operator_name']}) - {timestamp}"
             item = QListWidgetItem(item_text)
             item.setData(Qt.UserRole, machine)
-            self.machine_history_list.addItem(item)
+            items.append(item)
+        if items:
+            self._fill_list_widget(self.machine_history_list, items, clear=False)
+        return bool(items)
+
+    def _on_machine_history_scrolled(self, value):
+        """Load another page of machine history once the list is scrolled near its end."""
+        if value >= self.machine_history_list.verticalScrollBar().maximum() - 5:
+            self._append_machine_history_page()
 
     def _validate_onedrive_inputs(self):
         """Validate inputs and update button state + banner."""
@@ -4562,30 +5361,35 @@ Please find the attached Excel report with complete device information including
 
     def _update_onedrive_status_indicator(self):
         try:
-            enabled = self.onedrive_manager.is_enabled()
+            # Read the flag from config until the manager has been created
+            if 'onedrive_manager' in self.__dict__:
+                enabled = self.onedrive_manager.is_enabled()
+            else:
+                enabled = self.config.get('onedrive', {}).get('enabled', False)
             txt = QCoreApplication.translate("MainWindow", "OneDrive: On") if enabled else QCoreApplication.translate("MainWindow", "OneDrive: Off")
             self.onedrive_status_label.setText(txt)
         except Exception:
             pass
 
+    def _device_filter_index(self):
+        """Return (device, lowercase search text) pairs for self.devices, built once per device list."""
+        if self._filter_index is None or self._filter_index[0] is not self.devices:
+            self._filter_index = (self.devices, [
+                (d, " ".join([d.get_display_name() or "", d.port or "", d.board_type.value or ""]).lower())
+                for d in self.devices
+            ])
+        return self._filter_index[1]
+
     def apply_device_filter(self):
         try:
             query = (self.filter_input.text() or "").lower().strip()
             type_sel = self.filter_type_combo.currentText()
-            src = list(self.devices)
-            def match(d):
-                if type_sel and type_sel != QCoreApplication.translate("MainWindow", "All"):
-                    if d.board_type.value != type_sel:
-                        return False
-                if not query:
-                    return True
-                hay = " ".join([
-                    d.get_display_name() or "",
-                    d.port or "",
-                    d.board_type.value or "",
-                ]).lower()
-                return query in hay
-            self.filtered_devices = [d for d in src if match(d)]
+            if type_sel == QCoreApplication.translate("MainWindow", "All"):
+                type_sel = ""
+            self.filtered_devices = [
+                d for d, hay in self._device_filter_index()
+                if (not type_sel or d.board_type.value == type_sel) and query in hay
+            ]
             self.update_device_table()
         except Exception:
             self.filtered_devices = list(self.devices)
@@ -4606,7 +5410,8 @@ Please find the attached Excel report with complete device information including
             self.config['machine_id_suffix'] = self.machine_id_suffix.currentText().strip()
         except Exception:
             pass
-        Config.save_config(self.config)
+        self._schedule_config_save()
+        self._refresh_settings_cache()
 
     def _detect_country_name(self) -> str:
         try:
@@ -4758,7 +5563,7 @@ Please find the attached Excel report with complete device information including
                 # Delay to ensure UI is ready
                 QTimer.singleShot(1000, self.show_quick_tour_dialog)
                 self.config['tour_seen'] = True
-                Config.save_config(self.config)
+                self._save_config_now()
         except Exception as e:
             logger.warning(f"Failed to check first run tour: {e}")
 
@@ -4828,21 +5633,24 @@ Please find the attached Excel report with complete device information including
     
     def _device_change_callback(self, event_type: str, device: Device):
         """Handle device changes from background thread using Qt signals."""
+        # Signal emission is thread-safe; the slot runs on the GUI thread
+        self.device_change_detected.emit(event_type, device)
+
+    def _on_device_change_detected(self, event_type: str, device: Device):
+        """Dispatch a device change on the GUI thread."""
         if event_type == "device_connected":
-            # Use QTimer to safely update GUI from main thread
-            QTimer.singleShot(0, lambda: self._handle_device_connected(device))
+            self._handle_device_connected(device)
         elif event_type == "device_disconnected":
-            # Use QTimer to safely update GUI from main thread
-            QTimer.singleShot(0, lambda: self._handle_device_disconnected(device))
-    
+            self._handle_device_disconnected(device)
+
+    def _schedule_refresh(self):
+        """Request a device refresh; bursts within the debounce window collapse into one."""
+        self._refresh_debounce_timer.start()
+
     def _handle_device_connected(self, device: Device):
         """Handle device connection in main thread."""
         self.log(f"[CONNECTED] Device connected: {device.get_display_name()}")
-        self.refresh_devices()  # Refresh the device table
-        try:
-            self._update_footer_devices()
-        except Exception:
-            pass
+        self._schedule_refresh()  # Refresh the device table; _on_scan_finished updates the footer
         try:
             self._auto_flash_on_connect(device)
         except Exception as e:
@@ -4851,11 +5659,7 @@ Please find the attached Excel report with complete device information including
     def _handle_device_disconnected(self, device: Device):
         """Handle device disconnection in main thread."""
         self.log(f"[DISCONNECTED] Device disconnected: {device.get_display_name()}")
-        self.refresh_devices()  # Refresh the device table
-        try:
-            self._update_footer_devices()
-        except Exception:
-            pass
+        self._schedule_refresh()  # Refresh the device table; _on_scan_finished updates the footer
 
     def _update_footer_devices(self):
         """Update the footer devices count label."""
@@ -4882,14 +5686,17 @@ Please find the attached Excel report with complete device information including
     def on_theme_changed(self, theme_name: str):
         """Handle theme change."""
         self.log(f"[THEME] Theme changed to: {theme_name}")
-        # Apply additional stylesheet if needed
+        # Apply additional stylesheet if needed; ThemeManager.apply_theme has usually set it already,
+        # and an app-wide setStyleSheet re-polishes every widget, so skip identical ones
         app = QApplication.instance()
         if app:
             stylesheet = self.theme_manager.get_theme_stylesheet(ThemeType(theme_name.split('_')[0]))
-            app.setStyleSheet(stylesheet)
+            if app.styleSheet() != stylesheet:
+                app.setStyleSheet(stylesheet)
     
     def update_ui_text(self):
         """Update UI text with current language using Qt translation."""
+        self._details_labels = None
         # Update window title
         self.setWindowTitle(QCoreApplication.translate("MainWindow", "AWG Kumulus Device Manager v1.0.0"))
         
@@ -4997,8 +5804,23 @@ Please find the attached Excel report with complete device information including
         from PySide6.QtCore import QEvent
         if event.type() == QEvent.LanguageChange:
             self.retranslateUi()
+        elif event.type() == QEvent.WindowStateChange and hasattr(self, 'footer_clock_label'):
+            # Stops the clock while minimized; catches it up when restored
+            self._update_footer_clock()
         super().changeEvent(event)
 
+    def showEvent(self, event):
+        """Refresh and restart the footer clock when the window is shown."""
+        super().showEvent(event)
+        if hasattr(self, 'footer_clock_label'):
+            self._update_footer_clock()
+
+    def hideEvent(self, event):
+        """Stop the footer clock while the window is hidden."""
+        super().hideEvent(event)
+        if getattr(self, '_clock_timer', None) is not None:
+            self._clock_timer.stop()
+
     def retranslateUi(self):
         """Re-apply all translations to visible UI elements."""
         self.update_ui_text()
@@ -5030,6 +5852,18 @@ Please find the attached Excel report with complete device information including
             self.footer_clock_label.setText(f"🕒 {localized_dt} · {offset_str}")
         except Exception as e:
             logger.debug(f"Footer clock update failed: {e}")
+        self._schedule_footer_clock()
+
+    def _schedule_footer_clock(self):
+        """Arm the clock timer for just after the next minute boundary, unless the window is hidden or minimized."""
+        timer = getattr(self, '_clock_timer', None)
+        if timer is None:
+            return
+        if not self.isVisible() or self.isMinimized():
+            timer.stop()
+            return
+        t = QTime.currentTime()
+        timer.start(60000 - (t.second() * 1000 + t.msec()) + self.CLOCK_TICK_SLACK_MS)
 
     def _format_footer_geo(self) -> str:
         """Return formatted footer text for location and timezone."""
@@ -5046,51 +5880,33 @@ Please find the attached Excel report with complete device information including
     
     def show_device_history_dialog(self):
         """Show device history dialog."""
+        if self._history_dialog is None:
+            self._history_dialog = self._build_history_dialog()
+        self._refresh_history_dialog()
+        self._history_dialog.setWindowState(Qt.WindowMaximized)
+        self._history_dialog.exec()
+
+    def _build_history_dialog(self):
+        """Create the device history dialog widgets once; rows are filled by _refresh_history_dialog."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Device History")
-        dialog.setWindowState(Qt.WindowMaximized)
         
         layout = QVBoxLayout()
         
         # Device history table
-        history_table = QTableWidget()
-        # Columns: Name, Type, UID, Port, Status, Last Seen, Connections, Machine ID
-        history_table.setColumnCount(8)
-        history_table.setHorizontalHeaderLabels([
+        self._history_model = DeviceTableModel([
             "Name", "Type", "UID", "Port", "Status", "Last Seen", "Connections", "Machine ID"
-        ])
-        
-        # Populate history
-        device_history = self.device_detector.get_device_history()
-        history_table.setRowCount(len(device_history))
-        
-        for row, (device_id, device) in enumerate(device_history.items()):
-            history_table.setItem(row, 0, QTableWidgetItem(device.get_display_name()))
-            history_table.setItem(row, 1, QTableWidgetItem(device.board_type.value))
-            history_table.setItem(row, 2, QTableWidgetItem(device.get_unique_id()))
-            history_table.setItem(row, 3, QTableWidgetItem(device.port))
-            history_table.setItem(row, 4, QTableWidgetItem(device.status))
-
-            last_seen = device.last_seen.split('T')[0] if device.last_seen else "Never"
-            history_table.setItem(row, 5, QTableWidgetItem(last_seen))
-            history_table.setItem(row, 6, QTableWidgetItem(str(device.connection_count)))
-            history_table.setItem(row, 7, QTableWidgetItem(self.machine_id.text() or "-"))
+        ], dialog)
         
+        history_table = QTableView()
+        history_table.setModel(self._history_model)
         history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(history_table)
         
         # Statistics
-        stats = self.device_detector.get_device_statistics()
-        stats_text = f"""
-        <b>Device Statistics:</b><br>
-        Total Devices: {stats['total_devices']}<br>
-        Connected: {stats['connected_devices']}<br>
-        Disconnected: {stats['disconnected_devices']}<br>
-        Templates: {stats['templates_count']}
-        """
-        stats_label = QLabel(stats_text)
-        stats_label.setStyleSheet("color: #333; font-size: 12px; background: #f0f0f0; padding: 10px; border-radius: 5px;")
-        layout.addWidget(stats_label)
+        self._history_stats_label = QLabel()
+        self._history_stats_label.setStyleSheet(_STATS_LABEL_STYLE)
+        layout.addWidget(self._history_stats_label)
         
         # Buttons
         buttons = QDialogButtonBox(QDialogButtonBox.Close)
@@ -5098,7 +5914,27 @@ Please find the attached Excel report with complete device information including
         layout.addWidget(buttons)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
+
+    def _refresh_history_dialog(self):
+        """Reload the history rows and statistics shown by the cached history dialog."""
+        device_history = self.device_detector.get_device_history()
+        machine_id = self.machine_id.text() or "-"
+        self._history_model.set_rows([
+            (
+                device.get_display_name(),
+                device.board_type.value,
+                device.get_unique_id(),
+                device.port,
+                device.status,
+                device.last_seen_date or "Never",
+                str(device.connection_count),
+                machine_id,
+            )
+            for device in device_history.values()
+        ])
+        stats = self.device_detector.get_device_statistics()
+        self._history_stats_label.setText(_DEVICE_STATS_TMPL.format_map(stats))
 
     def open_stm32_project_dialog(self):
         """Ask user for local project path or Git URL, then open STM32CubeIDE."""
@@ -5534,11 +6370,13 @@ Please find the attached Excel report with complete device information including
         templates_list = QListWidget()
         templates = self.device_detector.get_device_templates()
         
+        items = []
         for template_name, template_data in templates.items():
             item_text = f"{template_name} - {template_data.get('description', 'No description')}"
             item = QListWidgetItem(item_text)
             item.setData(Qt.UserRole, template_name)
-            templates_list.addItem(item)
+            items.append(item)
+        self._fill_list_widget(templates_list, items)
         
         layout.addWidget(templates_list)
         
@@ -5578,7 +6416,7 @@ Please find the attached Excel report with complete device information including
         # Search input
         search_layout = QHBoxLayout()
         search_input = QLineEdit()
-        search_input.setPlaceholderText("Enter search query...")
+        search_input.setPlaceholderText(self._PH_SEARCH)
         search_layout.addWidget(search_input)
 
         search_btn = QPushButton("Search")
@@ -5586,44 +6424,52 @@ Please find the attached Excel report with complete device information including
         layout.addLayout(search_layout)
 
         # Search results
-        results_table = QTableWidget()
-        results_table.setColumnCount(6)
-        results_table.setHorizontalHeaderLabels([
-            "Name", "Type", "Port", "Status", "Health", "Tags"
-        ])
+        results_model = DeviceTableModel(["Name", "Type", "Port", "Status", "Health", "Tags"], dialog)
+        results_table = QTableView()
+        results_table.setModel(results_model)
+        results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(results_table)
 
-        def perform_search():
+        # Rows built for recent queries; typed queries reuse them, Search/Enter rescans
+        search_cache = {}
+
+        def perform_search(use_cache=False):
             query = search_input.text().strip()
             if not query:
                 return
 
-            results = self.device_detector.search_devices(query)
-            results_table.setRowCount(len(results))
+            key = query.lower()
+            if use_cache and key in search_cache:
+                results_model.set_rows(*search_cache[key])
+                return
 
+            results = self.device_detector.search_devices(query)
+            rows = []
+            backgrounds = {}
             for row, device in enumerate(results):
-                results_table.setItem(row, 0, QTableWidgetItem(device.get_display_name()))
-                results_table.setItem(row, 1, QTableWidgetItem(device.board_type.value))
-                results_table.setItem(row, 2, QTableWidgetItem(device.port))
-                results_table.setItem(row, 3, QTableWidgetItem(device.status))
-
                 health_score = self.device_detector.get_device_health_score(device)
-                health_item = QTableWidgetItem(f"{health_score}%")
-                if health_score >= 80:
-                    health_item.setBackground(Qt.green)
-                elif health_score >= 60:
-                    health_item.setBackground(Qt.yellow)
-                else:
-                    health_item.setBackground(Qt.red)
-                results_table.setItem(row, 4, health_item)
-
-                tags = ", ".join(device.tags) if device.tags else "None"
-                results_table.setItem(row, 5, QTableWidgetItem(tags))
-
-            results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
-        search_btn.clicked.connect(perform_search)
-        search_input.returnPressed.connect(perform_search)
+                backgrounds[(row, 4)] = self._health_band(health_score)[1]
+                rows.append((
+                    device.get_display_name(),
+                    device.board_type.value,
+                    device.port,
+                    device.status,
+                    f"{health_score}%",
+                    ", ".join(device.tags) if device.tags else "None",
+                ))
+            results_model.set_rows(rows, backgrounds)
+            search_cache.pop(key, None)
+            search_cache[key] = (rows, backgrounds)
+            if len(search_cache) > self.SEARCH_CACHE_SIZE:
+                search_cache.pop(next(iter(search_cache)))
+
+        search_timer = QTimer(dialog)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        search_timer.timeout.connect(lambda: perform_search(use_cache=True))
+        search_input.textChanged.connect(lambda _: search_timer.start())
+        search_btn.clicked.connect(lambda: perform_search())
+        search_input.returnPressed.connect(lambda: perform_search())
 
         # Buttons
         buttons = QDialogButtonBox(QDialogButtonBox.Close)
@@ -5738,12 +6584,7 @@ Please find the attached Excel report with complete device information including
         # Health score display
         health_score = self.device_detector.get_device_health_score(device)
         health_label = QLabel(f"<b>{QCoreApplication.translate('MainWindow', 'Health Score:')}</b> {health_score}%")
-        if health_score >= 80:
-            health_label.setStyleSheet("color: green;")
-        elif health_score >= 60:
-            health_label.setStyleSheet("color: orange;")
-        else:
-            health_label.setStyleSheet("color: red;")
+        health_label.setStyleSheet(self._health_band(health_score)[2])
         layout.addWidget(health_label)
         
         # Buttons
@@ -5765,7 +6606,8 @@ Please find the attached Excel report with complete device information including
             # Save to history
             self.device_detector.update_device_in_history(device)
             
-            # Refresh table
+            # Refresh table; the custom name is part of the filter search text
+            self._filter_index = None
             self.update_device_table()
             
             QMessageBox.information(self, "Success", QCoreApplication.translate("MainWindow", "Device customized successfully!"))
@@ -5805,7 +6647,7 @@ Please find the attached Excel report with complete device information including
             
             for row, backup in enumerate(backups):
                 # Date
-                backup_date = backup.backup_date.split('T')[0] if backup.backup_date else "Unknown"
+                backup_date = backup.backup_date[:10] if backup.backup_date else "Unknown"
                 backups_table.setItem(row, 0, QTableWidgetItem(backup_date))
                 
                 # Version
@@ -6099,20 +6941,8 @@ Please find the attached Excel report with complete device information including
         form_layout.addRow(QLabel("Serial:"), QLabel(device.serial_number or "N/A"))
         form_layout.addRow(QLabel("Manufacturer:"), QLabel(device.manufacturer or "N/A"))
         
-        def _fmt_hex(val):
-            try:
-                if val is None:
-                    return None
-                if isinstance(val, int):
-                    return f"0x{val:04X}"
-                s = str(val).strip()
-                if s.lower().startswith("0x"):
-                    return f"0x{int(s,16):04X}"
-                return f"0x{int(s):04X}"
-            except Exception:
-                return str(val)
                 
-        form_layout.addRow(QLabel("VID:PID:"), QLabel(f"{_fmt_hex(device.vid)}:{_fmt_hex(device.pid)}" if device.vid and device.pid else "N/A"))
+        form_layout.addRow(QLabel("VID:PID:"), QLabel(device.vid_pid))
         form_group.setLayout(form_layout)
         main_layout.addWidget(form_group)
         
@@ -6138,6 +6968,28 @@ Please find the attached Excel report with complete device information including
         d.exec()
 
 class ChipDelegate(QStyledItemDelegate):
+    # Status text -> chip style; anything else uses "other"
+    _STATUS_KIND = {"connected": "connected", "disconnected": "disconnected"}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bg_cache = {}  # (palette cache key, kind) -> QColor
+
+    def _chip_color(self, pal, text):
+        kind = self._STATUS_KIND.get(text.lower(), "other")
+        key = (pal.cacheKey(), kind)
+        bg = self._bg_cache.get(key)
+        if bg is None:
+            if kind == "connected":
+                bg = pal.highlight().color().lighter(160)
+            elif kind == "disconnected":
+                bg = pal.brightText().color()
+                bg = QColor(bg.red(), max(0, bg.green()-120), max(0, bg.blue()-120)).lighter(140)
+            else:
+                bg = pal.highlight().color().lighter(200)
+            self._bg_cache[key] = bg
+        return bg
+
     def paint(self, painter, option, index):
         col = index.column()
         text = str(index.data()) if index.data() is not None else ""
@@ -6147,18 +6999,8 @@ class ChipDelegate(QStyledItemDelegate):
             painter.setRenderHint(QPainter.Antialiasing, True)
             rect = option.rect.adjusted(6, 6, -6, -6)
             pal = option.palette
-            bg = pal.alternateBase().color()
             fg = pal.windowText().color()
-            
-            # Status column logic
-            t = text.lower()
-            if "connected" in t:
-                bg = pal.highlight().color().lighter(160)
-            elif "disconnected" in t:
-                bg = pal.brightText().color()
-                bg = QColor(bg.red(), max(0, bg.green()-120), max(0, bg.blue()-120)).lighter(140)
-            else:
-                bg = pal.highlight().color().lighter(200)
+            bg = self._chip_color(pal, text)
 
             painter.setBrush(bg)
             painter.setPen(Qt.NoPen)
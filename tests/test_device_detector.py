@@ -14,6 +14,25 @@ class TestDeviceDetector:
         assert detector is not None
         assert detector.logger is not None
     
+    def test_next_poll_interval(self):
+        """Test monitoring polls fast after a change and backs off to the idle cap."""
+        detector = DeviceDetector()
+        interval = detector._next_poll_interval(detector.monitoring_interval, changed=True)
+        assert interval == DeviceDetector.MONITOR_ACTIVE_INTERVAL
+        for _ in range(20):
+            interval = detector._next_poll_interval(interval, changed=False)
+        assert interval == DeviceDetector.MONITOR_IDLE_INTERVAL
+
+    def test_hotplug_backend_lengthens_idle_poll(self):
+        """Test a hot-plug notification wakes the loop and relaxes the idle cap."""
+        detector = DeviceDetector()
+        detector.notify_hotplug("test")
+        assert detector._hotplug_event.is_set()
+        interval = DeviceDetector.MONITOR_ACTIVE_INTERVAL
+        for _ in range(20):
+            interval = detector._next_poll_interval(interval, changed=False)
+        assert interval == DeviceDetector.MONITOR_HOTPLUG_IDLE_INTERVAL
+    
     @patch('serial.tools.list_ports.comports')
     def test_detect_devices_empty(self, mock_comports):
         """Test device detection with no devices."""
@@ -56,4 +75,23 @@ class TestDeviceDetector:
         assert device_dict['board_type'] == "STM32"
         assert device_dict['vid'] == "0x0483"
         assert device_dict['pid'] == "0x5740"
+    
+    def test_device_vid_pid(self):
+        """Test cached VID:PID label follows VID/PID changes."""
+        device = Device(port="COM3", board_type=BoardType.STM32, vid=0x0483, pid="0x5740")
+        assert device.vid_pid == "0x0483:0x5740"
+        device.pid = None
+        assert device.vid_pid == "N/A"
+    
+    def test_device_display_label(self):
+        """Test list label includes the manufacturer and follows field changes."""
+        device = Device(port="COM3", board_type=BoardType.STM32)
+        assert device.display_label == "STM32 - COM3"
+        device.manufacturer = "STMicroelectronics"
+        assert device.display_label == "STM32 - COM3 (STMicroelectronics)"
+    
+    def test_device_last_seen_date(self):
+        """Test last_seen_date is the date part of last_seen."""
+        device = Device(port="COM3", board_type=BoardType.STM32, last_seen="2024-05-06T07:08:09")
+        assert device.last_seen_date == "2024-05-06"
 
@@ -74,3 +74,18 @@ class TestFirmwareFlasher:
         
         result = flasher.flash_firmware(mock_device, "invalid.txt")
         assert result is False
+
+    def test_download_firmware_uses_shared_session(self, flasher):
+        """Test downloads go through the firmware manager's pooled session."""
+        response = MagicMock()
+        response.headers = {'content-length': '4'}
+        response.iter_content.return_value = [b'ab', b'cd']
+        
+        with patch.object(flasher.firmware_manager.http_session, 'get', return_value=response) as mock_get:
+            path = flasher._download_firmware("https://example.com/fw.bin", None)
+        
+        try:
+            mock_get.assert_called_once_with("https://example.com/fw.bin", stream=True)
+            assert path.read_bytes() == b'abcd'
+        finally:
+            path.unlink()
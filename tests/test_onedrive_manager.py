@@ -0,0 +1,75 @@
+"""Tests for OneDrive manager helpers."""
+
+import hashlib
+from src.core.config import Config
+from src.core.onedrive_manager import OneDriveManager, copy_with_checksum
+
+
+class TestCopyWithChecksum:
+    """Test cases for copy_with_checksum."""
+
+    def test_copy_with_checksum(self, tmp_path):
+        """The copy matches the source and the digest is its SHA-256."""
+        data = b"firmware" * 20000
+        src = tmp_path / "fw.bin"
+        src.write_bytes(data)
+        dst = tmp_path / "copy.bin"
+
+        size, checksum = copy_with_checksum(src, dst)
+
+        assert dst.read_bytes() == data
+        assert size == len(data)
+        assert checksum == hashlib.sha256(data).hexdigest()
+
+
+class TestOneDriveManagerConfig:
+    """Test cases for OneDriveManager construction."""
+
+    def test_explicit_config_skips_loading(self, monkeypatch):
+        """A manager built from a given config does not read the saved one."""
+        def fail(cls):
+            raise AssertionError("load_config should not be called")
+        monkeypatch.setattr(Config, "load_config", classmethod(fail))
+        config = {"onedrive": {"enabled": True, "folder_path": "/tmp", "user_folder": "user"}}
+
+        manager = OneDriveManager(config)
+
+        assert manager.config is config
+        assert manager.is_enabled()
+
+
+class TestListMachines:
+    """Test cases for OneDriveManager.list_machines."""
+
+    def test_list_machines_reuses_recent_scan(self, tmp_path, monkeypatch):
+        """A second listing within the TTL is served from the cache unless forced."""
+        monkeypatch.setattr(Config, "load_config", classmethod(lambda cls: {
+            "onedrive": {"enabled": True, "folder_path": str(tmp_path), "user_folder": "user"}
+        }))
+        machine_folder = tmp_path / "user" / "Amphore" / "AMP-1"
+        machine_folder.mkdir(parents=True)
+        (machine_folder / "AMP-1_data.json").write_text('{"machine_info": {"machine_id": "AMP-1"}}')
+        manager = OneDriveManager()
+
+        assert manager.list_machines() == [{"machine_id": "AMP-1"}]
+        (machine_folder / "AMP-1_data.json").unlink()
+        assert manager.list_machines() == [{"machine_id": "AMP-1"}]
+        assert manager.list_machines(force_refresh=True) == []
+
+    def test_apply_config_drops_cache_only_on_onedrive_change(self, tmp_path):
+        """Unrelated config changes keep cached listings; OneDrive changes clear them."""
+        onedrive = {"enabled": True, "folder_path": str(tmp_path), "user_folder": "user"}
+        manager = OneDriveManager({"onedrive": onedrive})
+        manager._machines_cache[("key", None)] = (0.0, [])
+
+        manager.apply_config({"onedrive": dict(onedrive), "theme": "dark"})
+        assert manager._machines_cache
+
+        config = {"onedrive": dict(onedrive, user_folder="other")}
+        manager.apply_config(config)
+        assert not manager._machines_cache
+
+        manager._machines_cache[("key", None)] = (0.0, [])
+        config["onedrive"] = dict(onedrive)
+        manager.apply_config(config)
+        assert not manager._machines_cache